@@ -1,8 +1,25 @@
 from flask import Flask
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from app import ratelimit_storage
+from app.audit_log import audit_log
+from app.download_tokens import download_tokens
+from app.fragment_cache import fragment_cache
+from app.health import readiness
+from app.metrics import metrics
+from app.page_cache import page_cache
+from app.recaptcha import recaptcha
+from app.responsive_images import responsive_images
+from app.resume_file import resume_file
+from app.server_session import server_sessions
+from app.startup_profile import startup_profile
+from app.static_assets import static_assets
+from app.static_export import static_export
+from app.template_cache import template_cache
 import os
 
+ratelimit_storage.register()
+
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["1000 per day", "200 per hour", "50 per minute"],
@@ -21,7 +38,35 @@ def create_app():
         'RECAPTCHA_SECRET_KEY': os.environ.get('RECAPTCHA_SECRET_KEY'),
         'MAX_CONTENT_LENGTH': 16 * 1024 * 1024,
         'RESUME_DOWNLOAD_LIMIT': int(os.environ.get('RESUME_DOWNLOAD_LIMIT', 5)),
-        'SEND_FILE_MAX_AGE_DEFAULT': 31536000
+        'SEND_FILE_MAX_AGE_DEFAULT': 31536000,
+        'PAGE_CACHE_ENABLED': os.environ.get('PAGE_CACHE_ENABLED', 'true').lower() == 'true',
+        'PAGE_CACHE_CHECK_INTERVAL': float(os.environ.get('PAGE_CACHE_CHECK_INTERVAL', 2)),
+        'PAGE_CACHE_PRELOAD': os.environ.get('PAGE_CACHE_PRELOAD', 'true').lower() == 'true',
+        'RECAPTCHA_VERIFIER': os.environ.get('RECAPTCHA_VERIFIER', 'http'),
+        'RECAPTCHA_TIMEOUT': float(os.environ.get('RECAPTCHA_TIMEOUT', 3)),
+        'RECAPTCHA_BREAKER_THRESHOLD': int(os.environ.get('RECAPTCHA_BREAKER_THRESHOLD', 5)),
+        'RECAPTCHA_BREAKER_RESET': float(os.environ.get('RECAPTCHA_BREAKER_RESET', 30)),
+        'RECAPTCHA_RESULT_TTL': float(os.environ.get('RECAPTCHA_RESULT_TTL', 120)),
+        'RECAPTCHA_SUCCESS_TTL': float(os.environ.get('RECAPTCHA_SUCCESS_TTL', 5)),
+        'CONTEXT_ANALYSIS_CACHE_TTL': float(os.environ.get('CONTEXT_ANALYSIS_CACHE_TTL', 300)),
+        'RESUME_OFFLOAD': os.environ.get('RESUME_OFFLOAD', ''),
+        'RESUME_ACCEL_PREFIX': os.environ.get('RESUME_ACCEL_PREFIX', '/protected/documents'),
+        'DOWNLOAD_TOKEN_TTL': int(os.environ.get('DOWNLOAD_TOKEN_TTL', 300)),
+        'DOWNLOAD_TOKEN_STORE': os.environ.get('DOWNLOAD_TOKEN_STORE', ''),
+        'AUDIT_LOG_ENABLED': os.environ.get('AUDIT_LOG_ENABLED', 'true').lower() == 'true',
+        'AUDIT_LOG_FILE': os.environ.get('AUDIT_LOG_FILE', ''),
+        'READINESS_CACHE_TTL': float(os.environ.get('READINESS_CACHE_TTL', 5)),
+        'TEMPLATE_PRECOMPILE': os.environ.get('TEMPLATE_PRECOMPILE', 'true').lower() == 'true',
+        'TEMPLATE_BYTECODE_CACHE_DIR': os.environ.get('TEMPLATE_BYTECODE_CACHE_DIR', ''),
+        'FRAGMENT_CACHE_ENABLED': os.environ.get('FRAGMENT_CACHE_ENABLED', 'true').lower() == 'true',
+        'STARTUP_IMPORT_BUDGET_MS': float(os.environ.get('STARTUP_IMPORT_BUDGET_MS', 300)),
+        'STATIC_FINGERPRINT': os.environ.get('STATIC_FINGERPRINT', 'true').lower() == 'true',
+        'STATIC_BUILD_DIR': os.environ.get('STATIC_BUILD_DIR', ''),
+        'STATIC_EXPORT_DIR': os.environ.get('STATIC_EXPORT_DIR', ''),
+        'RESPONSIVE_IMAGES_ENABLED': os.environ.get('RESPONSIVE_IMAGES_ENABLED', 'true').lower() == 'true',
+        'RESPONSIVE_IMAGE_DIR': os.environ.get('RESPONSIVE_IMAGE_DIR', ''),
+        'SESSION_BACKEND': os.environ.get('SESSION_BACKEND', 'sqlite:////tmp/reborncloud-sessions.db'),
+        'SESSION_NON_PERMANENT_TTL': int(os.environ.get('SESSION_NON_PERMANENT_TTL', 1800))
     })
     
     @app.after_request
@@ -37,8 +82,27 @@ def create_app():
         return response
     
     limiter.init_app(app)
+    server_sessions.init_app(app)
+    template_cache.init_app(app)
+    fragment_cache.init_app(app)
+    static_assets.init_app(app)
+    static_export.init_app(app)
+    responsive_images.init_app(app)
+    page_cache.init_app(app)
+    recaptcha.init_app(app)
+    resume_file.init_app(app)
+    download_tokens.init_app(app)
+    audit_log.init_app(app)
+    readiness.init_app(app)
+    startup_profile.init_app(app)
     
     from app.routes import main
     app.register_blueprint(main)
+    metrics.init_app(app)
+
+    if app.config['TEMPLATE_PRECOMPILE']:
+        template_cache.precompile(app)
+    if app.config['PAGE_CACHE_PRELOAD']:
+        page_cache.warm(app)
 
     return app
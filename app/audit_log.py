@@ -0,0 +1,164 @@
+"""
+Structured audit log for resume access
+Records are queued in memory and written as JSON lines by a background thread
+in batches, so request latency never depends on the speed of the log sink.
+Every worker appends to the same AUDIT_LOG_FILE, one O_APPEND write per batch,
+and rotation is left to logrotate: like logging's WatchedFileHandler, a writer
+reopens the file once the path points at a new inode
+"""
+
+from datetime import datetime, timezone
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+
+class AuditLog:
+    """Bounded queue plus batching writer thread, started lazily in each worker"""
+
+    def __init__(self, app=None):
+        self.enabled = False
+        self.batch_size = 256
+        self.flush_interval = 1.0
+        self.path = None
+        self.logger = None
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.write_errors = 0
+        self._queue = queue.Queue(maxsize=10000)
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._fd = None
+        self._inode = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('AUDIT_LOG_ENABLED', True)
+        app.config.setdefault('AUDIT_LOG_QUEUE_SIZE', 10000)
+        app.config.setdefault('AUDIT_LOG_BATCH_SIZE', 256)
+        app.config.setdefault('AUDIT_LOG_FLUSH_INTERVAL', 1.0)
+        app.config.setdefault('AUDIT_LOG_FILE', '')
+
+        self.enabled = app.config['AUDIT_LOG_ENABLED']
+        self.batch_size = app.config['AUDIT_LOG_BATCH_SIZE']
+        self.flush_interval = app.config['AUDIT_LOG_FLUSH_INTERVAL']
+        self.path = app.config['AUDIT_LOG_FILE'] or None
+        self.logger = app.logger
+        self._queue = queue.Queue(maxsize=app.config['AUDIT_LOG_QUEUE_SIZE'])
+        app.extensions['audit_log'] = self
+
+    def emit(self, event, **fields):
+        """Queue one record; never blocks, counting a drop when the queue is full"""
+        record = {'timestamp': time.time(), 'event': event}
+        record.update(fields)
+        if not self.enabled:
+            if self.logger is not None:
+                self.logger.info(json.dumps(record, default=str))
+            return
+
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(record)
+            queued = True
+        except queue.Full:
+            queued = False
+        # emit runs on every request thread, so the counters need the lock
+        with self._stats_lock:
+            if queued:
+                self.enqueued += 1
+            else:
+                self.dropped += 1
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                'enqueued': self.enqueued,
+                'written': self.written,
+                'dropped': self.dropped,
+                'batches': self.batches,
+                'write_errors': self.write_errors,
+                'queue_depth': self._queue.qsize()
+            }
+
+    def flush(self, timeout=5.0):
+        """Wait until everything queued so far has been written"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def _ensure_writer(self):
+        # The writer is started on first use in each process: a thread started
+        # in the gunicorn master would not survive the --preload fork
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._thread = threading.Thread(target=self._run, name='audit-log-writer', daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+            atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write(self, batch):
+        for record in batch:
+            record['timestamp'] = datetime.fromtimestamp(record['timestamp'], timezone.utc).isoformat()
+        lines = ''.join(json.dumps(record, default=str) + '\n' for record in batch)
+        try:
+            if self.path is None:
+                sys.stdout.write(lines)
+                sys.stdout.flush()
+            else:
+                # One write per batch on an O_APPEND descriptor, so batches from
+                # different workers never interleave within a line
+                os.write(self._open_fd(), lines.encode('utf-8'))
+            ok = True
+        except (OSError, ValueError):
+            ok = False
+        with self._stats_lock:
+            if ok:
+                self.written += len(batch)
+                self.batches += 1
+            else:
+                self.write_errors += 1
+
+    def _open_fd(self):
+        try:
+            inode = os.stat(self.path).st_ino
+        except FileNotFoundError:
+            inode = None
+        if self._fd is not None and inode != self._inode:
+            # Rotated or removed by logrotate: follow the path to the new file
+            os.close(self._fd)
+            self._fd = None
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o640)
+            self._inode = os.fstat(self._fd).st_ino
+        return self._fd
+
+
+audit_log = AuditLog()
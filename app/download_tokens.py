@@ -0,0 +1,119 @@
+"""
+Stateless, HMAC-signed download tokens
+Tokens carry their own expiry and a single-use nonce, so verification needs no
+session I/O; consumed nonces are recorded until their token expires in a
+NonceStore shared by every worker (DOWNLOAD_TOKEN_STORE, by default the
+session backend's database when that is shared, otherwise the SQLite session
+file), kept in its own table or Redis key prefix apart from sessions
+"""
+
+from app.server_session import DEFAULT_SQLITE_PATH, backend_from_url
+import base64
+import hashlib
+import hmac
+import math
+import os
+import struct
+import time
+
+TOKEN_VERSION = 1
+TOKEN_KINDS = {'standard': 0, 'professional': 1}
+_PAYLOAD = struct.Struct('>BIB16s')
+_SIGNATURE_SIZE = 16
+SHARED_STORE_SCHEMES = ('sqlite:', 'redis:')
+NONCE_NAMESPACE = 'download_nonces'
+
+
+class NonceStore:
+    """Records used nonces until they expire, in any session backend under its own namespace"""
+
+    def __init__(self, url):
+        # Unbounded: a nonce evicted before its token expires would make the token usable again
+        self.backend = backend_from_url(url, max_entries=None, namespace=NONCE_NAMESPACE)
+
+    def is_used(self, nonce):
+        return self.backend.get(nonce.hex()) is not None
+
+    def use(self, nonce, ttl):
+        """Atomically record ``nonce``; False if it was already recorded"""
+        return self.backend.add(nonce.hex(), b'1', ttl)
+
+
+class DownloadTokens:
+    """Issues and verifies self-expiring download tokens signed with the app secret"""
+
+    def __init__(self, app=None):
+        self._key = None
+        self.ttl = 300
+        self.consumed = None
+        self.logger = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('DOWNLOAD_TOKEN_TTL', 300)
+        app.config.setdefault('DOWNLOAD_TOKEN_STORE', '')
+        self.ttl = int(app.config['DOWNLOAD_TOKEN_TTL'])
+        self._key = hashlib.sha256(b'download-token:' + str(app.config['SECRET_KEY']).encode('utf-8')).digest()
+        store = app.config['DOWNLOAD_TOKEN_STORE'] or app.config.get('SESSION_BACKEND', '')
+        if not app.config['DOWNLOAD_TOKEN_STORE'] and not store.startswith(SHARED_STORE_SCHEMES):
+            # Cookie and memory:// sessions are not shared between workers
+            store = f"sqlite://{DEFAULT_SQLITE_PATH}"
+        self.consumed = NonceStore(store)
+        self.logger = app.logger
+        app.extensions['download_tokens'] = self
+
+    def _sign(self, payload):
+        return hmac.new(self._key, payload, hashlib.sha256).digest()[:_SIGNATURE_SIZE]
+
+    def issue(self, kind='standard'):
+        payload = _PAYLOAD.pack(TOKEN_VERSION, int(time.time()) + self.ttl, TOKEN_KINDS[kind], os.urandom(16))
+        return base64.urlsafe_b64encode(payload + self._sign(payload)).rstrip(b'=').decode('ascii')
+
+    def verify(self, token, allow_consumed=False):
+        """Return the token's claims if it is authentic, unexpired and (unless allowed) unused"""
+        if not token or len(token) > 64:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        except (ValueError, TypeError):
+            return None
+        if len(raw) != _PAYLOAD.size + _SIGNATURE_SIZE:
+            return None
+
+        payload, signature = raw[:_PAYLOAD.size], raw[_PAYLOAD.size:]
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            return None
+
+        version, expires, kind, nonce = _PAYLOAD.unpack(payload)
+        kind = next((name for name, code in TOKEN_KINDS.items() if code == kind), None)
+        if version != TOKEN_VERSION or kind is None or expires <= time.time():
+            return None
+        if not allow_consumed and self._is_consumed(nonce):
+            return None
+
+        return {
+            'kind': kind,
+            'expires': expires,
+            'nonce': nonce
+        }
+
+    def _is_consumed(self, nonce):
+        try:
+            return self.consumed.is_used(nonce)
+        except Exception as e:
+            # Fail closed: an unreadable store must not turn tokens reusable
+            self.logger.error(f"Download token store lookup failed: {str(e)}")
+            return True
+
+    def consume(self, claims):
+        """Atomically mark a verified token's nonce as used; False if it already was"""
+        ttl = max(1, math.ceil(claims['expires'] - time.time()))
+        try:
+            return self.consumed.use(claims['nonce'], ttl)
+        except Exception as e:
+            self.logger.error(f"Download token store update failed: {str(e)}")
+            return False
+
+
+download_tokens = DownloadTokens()
@@ -0,0 +1,95 @@
+"""
+Rendered fragment cache for templates
+``{% cache <values> %}...{% endcache %}`` renders its body once per content
+version, request script root and combination of the listed values, then
+serves the stored markup. Used for the layout parts every page repeats, such
+as the navigation with its url_for links, which cost as much to render as a
+small page's own content. The markup stays in the template that declares it,
+so the page cache and static export still see it as that template's output
+"""
+
+from flask import has_request_context, request
+from jinja2 import nodes
+from jinja2.ext import Extension
+from app.resume_content import get_resume
+import os
+import threading
+
+MAX_FRAGMENTS = 256
+
+
+class FragmentCacheExtension(Extension):
+    """Jinja extension adding the ``cache`` tag"""
+
+    tags = {'cache'}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._fragments = {}
+        self._version = None
+        self._lock = threading.Lock()
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        # A token fresh on every compile, so an edited and recompiled template
+        # never serves markup stored by its previous version
+        values = [nodes.Const(f"{parser.name}:{lineno}:{os.urandom(8).hex()}")]
+        while parser.stream.current.type != 'block_end':
+            if len(values) > 1:
+                parser.stream.expect('comma')
+            values.append(parser.parse_expression())
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        call = self.call_method('_render', [nodes.Tuple(values, 'load')])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render(self, key, caller):
+        if not self.enabled:
+            return caller()
+        script_root = request.script_root if has_request_context() else None
+        key = (script_root, *key)
+        resume = get_resume()
+        with self._lock:
+            if resume.version != self._version:
+                self._fragments = {}
+                self._version = resume.version
+            markup = self._fragments.get(key)
+        if markup is not None:
+            self.hits += 1
+            return markup
+
+        markup = caller()
+        self.misses += 1
+        with self._lock:
+            if resume.version == self._version and len(self._fragments) < MAX_FRAGMENTS:
+                self._fragments[key] = markup
+        return markup
+
+    def clear(self):
+        with self._lock:
+            self._fragments = {}
+            self._version = None
+
+
+class FragmentCache:
+    """Adds the ``cache`` tag to the app's Jinja environment"""
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('FRAGMENT_CACHE_ENABLED', True)
+        # Must be in place before the first template is compiled; when
+        # disabled the tag still parses and always renders its body
+        app.jinja_env.add_extension(FragmentCacheExtension)
+        self.extension(app).enabled = app.config['FRAGMENT_CACHE_ENABLED']
+        app.extensions['fragment_cache'] = self
+
+    def extension(self, app):
+        return app.jinja_env.extensions[FragmentCacheExtension.identifier]
+
+
+fragment_cache = FragmentCache()
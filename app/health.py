@@ -0,0 +1,80 @@
+"""
+Liveness and readiness probes
+Liveness answers with a body built once at import; readiness runs the real
+dependency checks at most once per READINESS_CACHE_TTL seconds per worker, so
+frequent Docker/ECS probes never turn into repeated work
+"""
+
+from app.recaptcha import recaptcha
+from app.resume_file import resume_file
+import json
+import os
+import threading
+import time
+
+VERSION = '2.0.0'
+LIVENESS_BODY = json.dumps({'status': 'healthy', 'version': VERSION}).encode('utf-8')
+
+
+class Readiness:
+    """Cached deep checks of everything a request may depend on"""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.ttl = 5.0
+        self._result = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('READINESS_CACHE_TTL', 5.0)
+        self.app = app
+        self.ttl = float(app.config['READINESS_CACHE_TTL'])
+        app.extensions['readiness'] = self
+
+    def status(self):
+        """Return ``(ready, checks)``, reusing the last result while it is fresh"""
+        now = time.monotonic()
+        if self._result is not None and now - self._checked_at < self.ttl:
+            return self._result
+        with self._lock:
+            if self._result is None or time.monotonic() - self._checked_at >= self.ttl:
+                checks = {
+                    'templates': self._check_templates(),
+                    'resume_pdf': self._check_resume(),
+                    'rate_limit_storage': self._check_rate_limit_storage(),
+                    'recaptcha': 'circuit_open' if recaptcha.circuit_open else 'ok'
+                }
+                self._result = (all(value == 'ok' for value in checks.values()), checks)
+                self._checked_at = time.monotonic()
+        return self._result
+
+    def _check_templates(self):
+        env = self.app.jinja_env
+        try:
+            for name in env.list_templates(filter_func=lambda name: name.endswith('.html')):
+                env.get_template(name)
+        except Exception as e:
+            self.app.logger.error(f"Readiness: template failed to compile: {str(e)}")
+            return 'error'
+        return 'ok'
+
+    def _check_resume(self):
+        if not resume_file.available or not os.access(resume_file.path, os.R_OK):
+            return 'unavailable'
+        return 'ok'
+
+    def _check_rate_limit_storage(self):
+        for limiter in self.app.extensions.get('limiter', ()):
+            try:
+                if not limiter.storage.check():
+                    return 'unreachable'
+            except Exception as e:
+                self.app.logger.error(f"Readiness: rate limit storage check failed: {str(e)}")
+                return 'unreachable'
+        return 'ok'
+
+
+readiness = Readiness()
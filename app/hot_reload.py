@@ -0,0 +1,59 @@
+"""
+Hot-reloaded data files
+A registry holds one immutable object built from a data file and swaps in a
+new one when the file's mtime changes, checking at most every
+reload_interval seconds. Readers never block on a check in progress; a file
+that fails to load keeps the previous object in service until it changes again
+"""
+
+from flask import current_app, has_app_context
+import os
+import threading
+import time
+
+
+class HotReloadRegistry:
+    """Base for registries of an object loaded from ``path``; subclasses implement ``load``"""
+
+    description = 'Data file'
+    # Load failures that keep the previous object instead of propagating
+    errors = (OSError, ValueError)
+
+    def __init__(self, path, reload_interval):
+        self.path = path
+        self.reload_interval = reload_interval
+        self._current = None
+        self._mtime = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def load(self, path):
+        raise NotImplementedError
+
+    def get(self):
+        current = self._current
+        if current is not None and time.monotonic() - self._checked_at < self.reload_interval:
+            return current
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                mtime = None
+            if self._current is None or mtime != self._mtime:
+                self._reload(mtime)
+            return self._current
+
+    def _reload(self, mtime):
+        try:
+            current = self.load(self.path)
+        except self.errors as e:
+            if self._current is None:
+                raise
+            if has_app_context():
+                current_app.logger.error(f"{self.description} reload failed, keeping the previous version: {str(e)}")
+            # Not retried until the file changes again
+            self._mtime = mtime
+            return
+        self._current = current
+        self._mtime = mtime
@@ -0,0 +1,239 @@
+"""
+Prometheus-style request metrics
+Counters and histograms are laid out in an anonymous shared memory arena that
+is sized at import time and carved up in create_app, before gunicorn forks
+its --preload workers, so /metrics reports totals across every worker
+"""
+
+from flask import request, before_render_template, template_rendered
+import mmap
+import multiprocessing
+import threading
+import time
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.2, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (512, 2048, 8192, 32768, 131072, 524288, 2097152)
+STATUS_CLASSES = ('1xx', '2xx', '3xx', '4xx', '5xx')
+RECAPTCHA_OUTCOMES = ('success', 'failure', 'error')
+OTHER = 'other'
+# Values are stored as integers; durations in microseconds
+MICROS = 1_000_000
+
+
+class SharedArena:
+    """Fixed pool of int64 slots in memory shared with forked children"""
+
+    def __init__(self, slots=32768):
+        self._memory = mmap.mmap(-1, slots * 8)
+        self.values = memoryview(self._memory).cast('q')
+        self.lock = multiprocessing.Lock()
+        self.used = 0
+
+    def allocate(self, count):
+        if self.used + count > len(self.values):
+            raise MemoryError("metrics arena exhausted")
+        offset, self.used = self.used, self.used + count
+        return offset
+
+    def snapshot(self):
+        with self.lock:
+            return self.values[:self.used].tolist()
+
+
+# One arena per process: create_app may run more than once (tests, the
+# export CLI), and every app registers into the same families below
+arena = SharedArena()
+
+
+class Metric:
+    """A metric with a fixed set of label combinations allocated up front"""
+
+    kind = None
+    width = 1
+
+    def __init__(self, arena, name, documentation, labelnames, labelsets):
+        self.arena = arena
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.offsets = {}
+        fallback = tuple(OTHER for _ in self.labelnames)
+        self.extend(list(labelsets) + [fallback])
+        self.fallback = self.offsets[fallback]
+
+    def extend(self, labelsets):
+        """Allocate the label combinations not seen yet; existing series keep their slots"""
+        for labels in labelsets:
+            labels = tuple(labels)
+            if labels not in self.offsets:
+                self.offsets[labels] = self.arena.allocate(self.width)
+
+    def _offset(self, labels):
+        offset = self.offsets.get(labels)
+        if offset is None:
+            # Unknown label values (e.g. unmatched URLs) share the "other" series
+            offset = self.offsets.get((OTHER,) + labels[1:], self.fallback)
+        return offset
+
+    def _format_labels(self, labels, extra=None):
+        pairs = list(zip(self.labelnames, labels))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{key}="{value}"' for key, value in pairs) + '}'
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, labels=(), amount=1):
+        offset = self._offset(labels)
+        with self.arena.lock:
+            self.arena.values[offset] += amount
+
+    def expose(self, values):
+        for labels, offset in self.offsets.items():
+            yield f"{self.name}{self._format_labels(labels)} {values[offset]}"
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, arena, name, documentation, labelnames, labelsets, buckets, scale=1):
+        self.buckets = tuple(buckets)
+        self.scale = scale
+        # One slot per bucket, one for +Inf, then sum and count
+        self.width = len(self.buckets) + 3
+        super().__init__(arena, name, documentation, labelnames, labelsets)
+
+    def observe(self, labels, value):
+        offset = self._offset(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        values = self.arena.values
+        with self.arena.lock:
+            values[offset + index] += 1
+            values[offset + len(self.buckets) + 1] += int(value * self.scale)
+            values[offset + len(self.buckets) + 2] += 1
+
+    def expose(self, values):
+        for labels, offset in self.offsets.items():
+            cumulative = 0
+            for i, bound in enumerate(self.buckets + (float('inf'),)):
+                cumulative += values[offset + i]
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                yield f"{self.name}_bucket{self._format_labels(labels, ('le', le))} {cumulative}"
+            total = values[offset + len(self.buckets) + 1] / self.scale
+            yield f"{self.name}_sum{self._format_labels(labels)} {total}"
+            yield f"{self.name}_count{self._format_labels(labels)} {values[offset + len(self.buckets) + 2]}"
+
+
+class Metrics:
+    """Flask extension timing requests, template renders and reCAPTCHA calls"""
+
+    def __init__(self, app=None):
+        self.arena = arena
+        self.metrics = {}
+        self._local = threading.local()
+        self.requests = None
+        self.recaptcha_latency = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Allocate every series; call after all blueprints are registered
+
+        Families are registered once per name; a later app only adds the
+        label combinations (endpoints, templates) the earlier ones lacked
+        """
+        endpoints = sorted(app.view_functions) + [OTHER]
+        templates = sorted(name for name in app.jinja_env.list_templates() if name.endswith('.html'))
+
+        self.requests = self._add(
+            Counter, 'http_requests_total', 'Requests handled, by endpoint and status class',
+            ('endpoint', 'status'), [(e, s) for e in endpoints for s in STATUS_CLASSES]
+        )
+        self.latency = self._add(
+            Histogram, 'http_request_duration_seconds', 'Request handling time',
+            ('endpoint',), [(e,) for e in endpoints], LATENCY_BUCKETS, scale=MICROS
+        )
+        self.response_size = self._add(
+            Histogram, 'http_response_size_bytes', 'Response body size',
+            ('endpoint',), [(e,) for e in endpoints], SIZE_BUCKETS
+        )
+        self.rate_limited = self._add(
+            Counter, 'ratelimit_rejections_total', 'Requests rejected by the rate limiter',
+            ('endpoint',), [(e,) for e in endpoints]
+        )
+        self.render_latency = self._add(
+            Histogram, 'template_render_duration_seconds', 'Jinja template render time',
+            ('template',), [(t,) for t in templates], LATENCY_BUCKETS, scale=MICROS
+        )
+        self.recaptcha_latency = self._add(
+            Histogram, 'recaptcha_request_duration_seconds', 'reCAPTCHA siteverify call time',
+            ('outcome',), [(o,) for o in RECAPTCHA_OUTCOMES], LATENCY_BUCKETS, scale=MICROS
+        )
+
+        # Run ahead of every other before_request hook (including the rate
+        # limiter's) so rejected requests are timed too
+        app.before_request_funcs.setdefault(None, []).insert(0, self._start_timer)
+        app.after_request(self._record_request)
+        before_render_template.connect(self._start_render, app)
+        template_rendered.connect(self._finish_render, app)
+        app.extensions['metrics'] = self
+
+    def _add(self, kind, name, documentation, labelnames, labelsets, *args, **kwargs):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = kind(self.arena, name, documentation, labelnames, labelsets, *args, **kwargs)
+        else:
+            metric.extend(labelsets)
+        return metric
+
+    def _start_timer(self):
+        request.environ['reborncloud.request_start'] = time.perf_counter()
+
+    def _record_request(self, response):
+        started = request.environ.get('reborncloud.request_start')
+        endpoint = request.endpoint or OTHER
+        status = f"{response.status_code // 100}xx"
+        self.requests.inc((endpoint, status))
+        if started is not None:
+            self.latency.observe((endpoint,), time.perf_counter() - started)
+        if response.content_length is not None:
+            self.response_size.observe((endpoint,), response.content_length)
+        if response.status_code == 429:
+            self.rate_limited.inc((endpoint,))
+        return response
+
+    def _start_render(self, sender, template, context, **extra):
+        stack = getattr(self._local, 'renders', None)
+        if stack is None:
+            stack = self._local.renders = []
+        stack.append(time.perf_counter())
+
+    def _finish_render(self, sender, template, context, **extra):
+        stack = getattr(self._local, 'renders', None)
+        if stack:
+            self.render_latency.observe((template.name,), time.perf_counter() - stack.pop())
+
+    def observe_recaptcha(self, seconds, outcome):
+        if self.recaptcha_latency is not None:
+            self.recaptcha_latency.observe((outcome,), seconds)
+
+    def expose(self):
+        """Render every metric in the Prometheus text exposition format"""
+        values = self.arena.snapshot()
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.expose(values))
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
@@ -0,0 +1,221 @@
+"""
+Pre-rendered page cache for the public portfolio pages
+Renders each cached view once per content version and serves the stored bytes
+with ETag/Last-Modified validators, answering conditional GETs with 304
+"""
+
+from flask import current_app, request, session, template_rendered
+from functools import wraps
+from jinja2 import meta
+import hashlib
+import os
+import sys
+import threading
+import time
+import weakref
+
+
+def template_dependencies(env, template_names):
+    """Map rendered templates plus everything they extend, include or import to their filenames"""
+    seen = {}
+    pending = list(template_names)
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        source, filename, _ = env.loader.get_source(env, name)
+        seen[name] = filename
+        for referenced in meta.find_referenced_templates(env.parse(source)):
+            if referenced:
+                pending.append(referenced)
+    return seen
+
+
+class CachedPage:
+    """A rendered response body together with the inputs it was rendered from"""
+
+    __slots__ = ('body', 'mimetype', 'etag', 'last_modified', 'version', 'templates', 'dependencies', 'checked_at')
+
+    def __init__(self, body, mimetype, version, templates, dependencies, last_modified):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.sha256(body).hexdigest()
+        self.last_modified = int(last_modified)
+        self.version = version
+        self.templates = templates
+        self.dependencies = dependencies
+        self.checked_at = time.monotonic()
+
+
+class PageCache:
+    """Process-local cache of rendered HTML keyed by endpoint"""
+
+    def __init__(self, app=None):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._content_version = None
+        self._content_checked_at = 0.0
+        self._content_value = None
+        self._content_modified = 0.0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('PAGE_CACHE_ENABLED', True)
+        app.config.setdefault('PAGE_CACHE_CHECK_INTERVAL', 2.0)
+        app.config.setdefault('PAGE_CACHE_PRELOAD', False)
+        template_rendered.connect(self._record_template, app)
+
+    def content_version(self, f=None, source=None):
+        """Register the callable that fingerprints the data behind cached pages
+
+        ``source`` names the file the data is loaded from, for Last-Modified;
+        it defaults to the module defining ``f``
+        """
+        if f is None:
+            return lambda f: self.content_version(f, source=source)
+        self._content_version = f
+        try:
+            self._content_modified = os.path.getmtime(source or sys.modules[f.__module__].__file__)
+        except (AttributeError, KeyError, OSError, TypeError):
+            self._content_modified = time.time()
+        return f
+
+    def cached(self, view):
+        """Serve the view's rendered output from the cache until its inputs change"""
+        @wraps(view)
+        def cached_view(*args, **kwargs):
+            if not current_app.config['PAGE_CACHE_ENABLED'] or args or kwargs or self._has_flashes():
+                return view(*args, **kwargs)
+
+            key = request.endpoint
+            entry = self._entries.get(key)
+            if entry is None or not self._is_fresh(entry):
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry is None or not self._is_fresh(entry):
+                        entry = self._render(view)
+                        if entry is None:
+                            return view()
+                        self._entries[key] = entry
+            return self._make_response(entry)
+
+        cached_view.page_cache_view = True
+        return cached_view
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._content_value = None
+
+    def warm(self, app):
+        """Render every cached view up front, e.g. during gunicorn --preload"""
+        for rule in app.url_map.iter_rules():
+            if 'GET' not in rule.methods or rule.arguments:
+                continue
+            view = app.view_functions.get(rule.endpoint)
+            while view is not None and not getattr(view, 'page_cache_view', False):
+                view = getattr(view, '__wrapped__', None)
+            if view is None:
+                continue
+            with app.test_request_context(rule.rule):
+                try:
+                    view()
+                except Exception as e:
+                    app.logger.warning(f"Page cache warm-up failed for {rule.rule}: {str(e)}")
+
+    def _has_flashes(self):
+        cookie_name = current_app.config['SESSION_COOKIE_NAME']
+        return cookie_name in request.cookies and '_flashes' in session
+
+    def _record_template(self, sender, template, context, **extra):
+        rendered = getattr(self._local, 'templates', None)
+        if rendered is not None:
+            rendered.append(template.name)
+
+    def _render(self, view):
+        self._local.templates = []
+        try:
+            rv = view()
+            templates = self._local.templates
+        finally:
+            self._local.templates = None
+
+        if isinstance(rv, str):
+            body, mimetype = rv.encode('utf-8'), 'text/html'
+        elif isinstance(rv, current_app.response_class) and rv.status_code == 200 and not rv.is_streamed:
+            body, mimetype = rv.get_data(), rv.mimetype
+        else:
+            return None
+
+        resolved = sorted(template_dependencies(current_app.jinja_env, templates).items())
+        templates = tuple(name for name, filename in resolved)
+        dependencies = tuple(filename for name, filename in resolved)
+        mtimes = self._template_mtimes(dependencies)
+        version = (mtimes, self.current_content_version(force=True))
+        last_modified = max([mtime for mtime in mtimes if mtime is not None] + [self._content_modified])
+        return CachedPage(body, mimetype, version, templates, dependencies, last_modified)
+
+    def _is_fresh(self, entry):
+        interval = 0 if current_app.debug else current_app.config['PAGE_CACHE_CHECK_INTERVAL']
+        now = time.monotonic()
+        if now - entry.checked_at < interval:
+            return True
+        version = (self._template_mtimes(entry.dependencies), self.current_content_version())
+        if version != entry.version:
+            if version[0] != entry.version[0]:
+                self._evict_templates(entry.templates)
+            return False
+        entry.checked_at = now
+        return True
+
+    @property
+    def content_modified(self):
+        """Wall-clock time the current content version was first published"""
+        return self._content_modified
+
+    def current_content_version(self, force=False):
+        """Return the registered content fingerprint, recomputed at most once per check interval"""
+        if self._content_version is None:
+            return None
+        interval = 0 if current_app.debug else current_app.config['PAGE_CACHE_CHECK_INTERVAL']
+        now = time.monotonic()
+        if force or self._content_value is None or now - self._content_checked_at >= interval:
+            value = self._content_version()
+            if self._content_value is not None and value != self._content_value:
+                self._content_modified = time.time()
+            self._content_value = value
+            self._content_checked_at = now
+        return self._content_value
+
+    def _evict_templates(self, names):
+        # Without auto_reload Jinja keeps serving the compiled template it has
+        # cached, so re-rendering after an edit would store the old markup
+        env = current_app.jinja_env
+        if env.cache is None:
+            return
+        loader = weakref.ref(env.loader)
+        for name in names:
+            try:
+                del env.cache[(loader, name)]
+            except KeyError:
+                pass
+
+    def _template_mtimes(self, filenames):
+        mtimes = []
+        for filename in filenames:
+            try:
+                mtimes.append(os.path.getmtime(filename))
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _make_response(self, entry):
+        response = current_app.response_class(entry.body, mimetype=entry.mimetype)
+        response.set_etag(entry.etag)
+        response.last_modified = entry.last_modified
+        return response.make_conditional(request)
+
+
+page_cache = PageCache()
@@ -4,13 +4,18 @@ Enterprise-grade security for portfolio resume access
 """
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session, current_app, jsonify
-from .professional_security import ProfessionalSecurityManager, get_contextual_challenge
+from .professional_security import get_security_manager, get_contextual_challenge, user_agent_cache_stats
 from .routes import limiter, log_download_attempt, generate_download_token, verify_recaptcha
-import time
+from .ttl_cache import TTLCache
+from .verification_context import encode_verification
+from .verification_stats import verification_stats
 import json
 
 professional = Blueprint('professional', __name__)
 
+# Precomputed /professional-context-analysis bodies keyed by context features
+context_responses = TTLCache(ttl=300, max_entries=512)
+
 @professional.route('/professional-resume-access')
 @limiter.limit("10 per minute")
 def professional_resume_access():
@@ -26,8 +31,8 @@ def professional_verify_access():
     ip_address = request.environ.get('REMOTE_ADDR', 'unknown')
     
     try:
-        # Initialize security manager
-        security_manager = ProfessionalSecurityManager()
+        # Shared, immutable security manager
+        security_manager = get_security_manager()
         
         # Get form data
         professional_email = request.form.get('professional_email', '').strip()
@@ -40,6 +45,7 @@ def professional_verify_access():
         # Validate required fields
         if not professional_email or not purpose:
             log_download_attempt(ip_address, False, "Missing required professional information")
+            verification_stats.record_failure('missing_information')
             flash('Please provide your professional email and access purpose.', 'error')
             return redirect(url_for('professional.professional_resume_access'))
         
@@ -93,6 +99,7 @@ def professional_verify_access():
         if challenge_answer is not None and challenge_correct is not None:
             if int(challenge_answer) != int(challenge_correct):
                 log_download_attempt(ip_address, False, "Professional challenge failed")
+                verification_stats.record_failure('challenge_failed')
                 flash('Professional verification challenge failed. Please try again.', 'error')
                 return redirect(url_for('professional.professional_resume_access'))
             else:
@@ -106,25 +113,29 @@ def professional_verify_access():
             recaptcha_response = request.form.get('g-recaptcha-response')
             if not verify_recaptcha(recaptcha_response):
                 log_download_attempt(ip_address, False, "reCAPTCHA verification failed")
+                verification_stats.record_failure('recaptcha_failed')
                 flash('reCAPTCHA verification failed. Please try again.', 'error')
                 return redirect(url_for('professional.professional_resume_access'))
         
         # Generate professional access token
-        token, token_data = security_manager.create_professional_access_token(
-            context, professional_email
-        )
+        token = generate_download_token('professional')
         
-        # Store verification data in session
-        session['professional_verification'] = {
-            'verified': True,
-            'timestamp': time.time(),
-            'context': context,
-            'token': token
-        }
+        # Keep only a compact record in the session
+        session['professional_verification'] = encode_verification(context)
         
         # Log successful verification
-        log_message = f"Professional access verified - Score: {context['total_score']}, Risk: {context['risk_level']}, Domain: {context['domain_type']}"
-        log_download_attempt(ip_address, True, log_message)
+        log_download_attempt(
+            ip_address, True, "Professional access verified",
+            score=context['total_score'],
+            risk_level=context['risk_level'],
+            domain_type=context['domain_type']
+        )
+        verification_stats.record_success(
+            context['risk_level'],
+            context['domain_type'],
+            context['total_score'],
+            challenge_passed=context.get('challenge_passed')
+        )
         
         # Success message based on context
         if context['risk_level'] == 'low':
@@ -140,6 +151,7 @@ def professional_verify_access():
     except Exception as e:
         current_app.logger.error(f"Professional verification error: {str(e)}")
         log_download_attempt(ip_address, False, f"Professional verification system error: {str(e)}")
+        verification_stats.record_failure('error')
         flash('Professional verification system temporarily unavailable. Please try again.', 'error')
         return redirect(url_for('professional.professional_resume_access'))
 
@@ -154,28 +166,41 @@ def professional_context_analysis():
         if not email:
             return jsonify({'error': 'Email required'}), 400
         
-        security_manager = ProfessionalSecurityManager()
-        context = security_manager.analyze_professional_context(
-            email=email,
-            user_agent=request.headers.get('User-Agent'),
-            referrer=request.headers.get('Referer')
-        )
-        
-        # Get appropriate challenge
-        challenge = get_contextual_challenge(context)
-        
-        response = {
-            'context': {
-                'domain_type': context['domain_type'],
-                'email_score': context['email_score'],
-                'risk_level': context['risk_level'],
-                'total_score': context['total_score']
-            },
-            'challenge': challenge,
-            'recommendations': get_access_recommendations(context)
-        }
+        security_manager = get_security_manager()
+        user_agent = request.headers.get('User-Agent')
+        referrer = request.headers.get('Referer')
         
-        return jsonify(response)
+        # Repeated lookups (the form re-analyses as the email is edited) reuse
+        # the body. There is deliberately no ETag: this is a POST, which
+        # clients never revalidate, and a GET variant would put email
+        # addresses in URLs and access logs
+        cache_key = (security_manager, security_manager.context_key(email, user_agent, referrer))
+        body = context_responses.get(cache_key)
+        if body is None:
+            context = security_manager.analyze_professional_context(
+                email=email,
+                user_agent=user_agent,
+                referrer=referrer
+            )
+            
+            # Get appropriate challenge
+            challenge = get_contextual_challenge(context)
+            
+            response = {
+                'context': {
+                    'domain_type': context['domain_type'],
+                    'email_score': context['email_score'],
+                    'risk_level': context['risk_level'],
+                    'total_score': context['total_score']
+                },
+                'challenge': challenge,
+                'recommendations': get_access_recommendations(context)
+            }
+            
+            body = f"{current_app.json.dumps(response)}\n".encode('utf-8')
+            context_responses.set(cache_key, body, ttl=current_app.config.get('CONTEXT_ANALYSIS_CACHE_TTL'))
+        
+        return current_app.response_class(body, mimetype='application/json')
         
     except Exception as e:
         current_app.logger.error(f"Context analysis error: {str(e)}")
@@ -220,13 +245,7 @@ def get_access_recommendations(context):
 def professional_stats():
     """Professional verification statistics (admin only)"""
     # This would typically require admin authentication
-    # For now, return basic stats
-    
-    stats = {
-        'total_verifications': session.get('verification_count', 0),
-        'corporate_access': session.get('corporate_count', 0),
-        'challenge_success_rate': session.get('challenge_success_rate', 0),
-        'average_context_score': session.get('avg_context_score', 0)
-    }
+    stats = verification_stats.snapshot()
+    stats['user_agent_cache'] = user_agent_cache_stats()
     
     return jsonify(stats)
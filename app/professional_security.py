@@ -3,55 +3,141 @@ Advanced Professional Security System for Portfolio Resume Downloads
 Implements enterprise-grade verification tailored for professional contexts
 """
 
+import os
 import re
-import requests
-import time
-import hashlib
 import json
-from datetime import datetime, timedelta
-from flask import request, session, current_app
-from functools import wraps
-import user_agents
+from dataclasses import dataclass
+from flask import request, session
+from functools import lru_cache, wraps
+from app.hot_reload import HotReloadRegistry
+from app.verification_context import encode_verification
 
-class ProfessionalSecurityManager:
-    """Advanced security manager for professional portfolio access"""
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'data', 'professional_security.json')
+
+USER_AGENT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=USER_AGENT_CACHE_SIZE)
+def classify_user_agent(user_agent):
+    """Reduce a raw User-Agent string to its device class: mobile, tablet or desktop"""
+    # user_agents loads its regex database on import; defer it to first use
+    import user_agents
+    ua = user_agents.parse(user_agent)
+    if ua.is_mobile:
+        return 'mobile'
+    if ua.is_tablet:
+        return 'tablet'
+    return 'desktop'
+
+
+def user_agent_cache_stats():
+    """Hit/miss counters for the user agent classification cache"""
+    info = classify_user_agent.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'max_size': info.maxsize,
+        'hit_rate': round(info.hits / lookups, 4) if lookups else 0
+    }
+
+
+class IndicatorMatcher:
+    """Finds every indicator occurring in a string with a single compiled regex scan"""
     
-    def __init__(self):
-        self.corporate_domains = {
-            # Tech Giants
-            'google.com', 'microsoft.com', 'apple.com', 'amazon.com', 'meta.com',
-            'netflix.com', 'uber.com', 'airbnb.com', 'spotify.com', 'zoom.us',
-            
-            # Consulting & Professional Services
-            'mckinsey.com', 'bcg.com', 'bain.com', 'deloitte.com', 'pwc.com',
-            'ey.com', 'kpmg.com', 'accenture.com', 'ibm.com', 'oracle.com',
-            
-            # Financial Services
-            'jpmorgan.com', 'goldmansachs.com', 'morganstanley.com', 'blackrock.com',
-            'citi.com', 'wellsfargo.com', 'bankofamerica.com', 'chase.com',
-            
-            # Healthcare & Pharma
-            'pfizer.com', 'jnj.com', 'roche.com', 'novartis.com', 'merck.com',
-            
-            # Aerospace & Defense
-            'boeing.com', 'lockheedmartin.com', 'raytheon.com', 'northropgrumman.com',
-            
-            # Automotive
-            'tesla.com', 'ford.com', 'gm.com', 'toyota.com', 'bmw.com',
-            
-            # Common corporate email patterns
-            'corp.com', 'company.com', 'inc.com', 'ltd.com', 'llc.com'
-        }
+    def __init__(self, indicators):
+        self.ordered = tuple(
+            (word, f"{category}:{word}")
+            for category, words in indicators
+            for word in words
+        )
         
-        self.professional_indicators = {
-            'high_value': ['ceo', 'cto', 'vp', 'director', 'manager', 'lead', 'senior', 'principal'],
-            'tech_roles': ['engineer', 'developer', 'architect', 'devops', 'sre', 'data', 'ml', 'ai'],
-            'business_roles': ['analyst', 'consultant', 'strategy', 'product', 'marketing', 'sales'],
-            'hr_recruiting': ['recruiter', 'hr', 'talent', 'hiring', 'people', 'recruitment']
+        # A lookahead around a longest-first alternation reports the longest
+        # indicator starting at every position, overlapping matches included;
+        # shorter indicators that are prefixes of it are implied by that match.
+        words = sorted({word for word, _ in self.ordered})
+        alternation = '|'.join(map(re.escape, sorted(words, key=len, reverse=True)))
+        self.pattern = re.compile('(?=(' + alternation + '))')
+        self.implied = {
+            word: tuple(other for other in words if word.startswith(other))
+            for word in words
+        }
+        self.single = {
+            word: [label for other, label in self.ordered if other in self.implied[word]]
+            for word in words
         }
     
+    def find(self, text):
+        """Return the matched ``category:indicator`` labels in declaration order"""
+        matches = self.pattern.findall(text)
+        if not matches:
+            return []
+        if len(matches) == 1:
+            return list(self.single[matches[0]])
+        found = set()
+        for word in matches:
+            found.update(self.implied[word])
+        return [label for word, label in self.ordered if word in found]
+
+
+@dataclass(frozen=True, slots=True)
+class SecurityConfig:
+    """Immutable classifier configuration with its compiled matchers"""
+    
+    corporate_domains: frozenset
+    professional_indicators: tuple
+    corporate_suffixes: tuple
+    personal_domains: frozenset
+    professional_referrers: tuple
+    indicator_matcher: IndicatorMatcher
+    corporate_pattern: re.Pattern
+    referrer_pattern: re.Pattern
+    
+    @classmethod
+    def from_dict(cls, data):
+        indicators = tuple(
+            (category, tuple(words))
+            for category, words in data['professional_indicators'].items()
+        )
+        suffixes = tuple(data['corporate_suffixes'])
+        referrers = tuple(data['professional_referrers'])
+        return cls(
+            corporate_domains=frozenset(data['corporate_domains']),
+            professional_indicators=indicators,
+            corporate_suffixes=suffixes,
+            personal_domains=frozenset(data['personal_domains']),
+            professional_referrers=referrers,
+            indicator_matcher=IndicatorMatcher(indicators),
+            corporate_pattern=re.compile(r'.*(?:' + '|'.join(re.escape(s) for s in suffixes) + r')\.com$'),
+            referrer_pattern=re.compile('|'.join(re.escape(ref) for ref in referrers))
+        )
+    
+    @classmethod
+    def load(cls, path=DEFAULT_CONFIG_PATH):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+class ProfessionalSecurityManager:
+    """Advanced security manager for professional portfolio access"""
+    
+    __slots__ = ('config',)
+    
+    def __init__(self, config=None):
+        self.config = config if config is not None else SecurityConfig.load()
+    
+    @property
+    def corporate_domains(self):
+        return self.config.corporate_domains
+    
+    @property
+    def professional_indicators(self):
+        return dict(self.config.professional_indicators)
+    
     def analyze_professional_context(self, email=None, user_agent=None, referrer=None):
         """Analyze the professional context of the access request"""
+        config = self.config
         context_score = 0
         context_details = {
             'email_score': 0,
@@ -67,34 +153,23 @@ class ProfessionalSecurityManager:
             domain = email.split('@')[-1].lower()
             context_details['domain'] = domain
             
-            if domain in self.corporate_domains:
-                context_score += 30
-                context_details['email_score'] = 30
-                context_details['domain_type'] = 'corporate'
-            elif self._is_corporate_pattern(domain):
-                context_score += 20
-                context_details['email_score'] = 20
-                context_details['domain_type'] = 'business'
-            elif domain in ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']:
-                context_score += 5
-                context_details['email_score'] = 5
-                context_details['domain_type'] = 'personal'
+            email_score, domain_type = self._classify_domain(domain)
+            context_score += email_score
+            context_details['email_score'] = email_score
+            context_details['domain_type'] = domain_type
             
             # Check for professional indicators in email
-            email_lower = email.lower()
-            for category, indicators in self.professional_indicators.items():
-                for indicator in indicators:
-                    if indicator in email_lower:
-                        context_score += 10
-                        context_details['professional_indicators'].append(f"{category}:{indicator}")
+            indicators = config.indicator_matcher.find(email.lower())
+            context_score += 10 * len(indicators)
+            context_details['professional_indicators'] = indicators
         
         # User agent analysis
         if user_agent:
-            ua = user_agents.parse(user_agent)
-            if ua.is_mobile:
+            device_type = classify_user_agent(user_agent)
+            if device_type == 'mobile':
                 context_details['device_type'] = 'mobile'
                 context_score += 5  # Mobile access is common for professionals
-            elif ua.is_tablet:
+            elif device_type == 'tablet':
                 context_details['device_type'] = 'tablet'
                 context_score += 8
             else:
@@ -102,13 +177,9 @@ class ProfessionalSecurityManager:
                 context_score += 15  # Desktop access suggests professional context
         
         # Referrer analysis
-        if referrer:
-            professional_referrers = ['linkedin.com', 'indeed.com', 'glassdoor.com', 'monster.com']
-            for prof_ref in professional_referrers:
-                if prof_ref in referrer.lower():
-                    context_score += 25
-                    context_details['access_pattern'] = 'professional_referral'
-                    break
+        if referrer and config.referrer_pattern.search(referrer.lower()):
+            context_score += 25
+            context_details['access_pattern'] = 'professional_referral'
         
         # Risk assessment
         if context_score >= 50:
@@ -121,25 +192,32 @@ class ProfessionalSecurityManager:
         context_details['total_score'] = context_score
         return context_details
     
+    def context_key(self, email=None, user_agent=None, referrer=None):
+        """Cache key for an analysis: the raw inputs, normalized as the analysis reads them"""
+        # No classification here, so a cache hit skips all of it. The whole
+        # lowercased email covers both the domain and the local part the
+        # indicators come from; the referrer stays whole because referrer
+        # rules may match anywhere in the URL, not only in its host
+        return (
+            email.lower() if email else None,
+            user_agent or None,
+            referrer.lower() if referrer else None
+        )
+    
+    def _classify_domain(self, domain):
+        """Return the (email_score, domain_type) for an email domain"""
+        config = self.config
+        if domain in config.corporate_domains:
+            return 30, 'corporate'
+        if config.corporate_pattern.match(domain):
+            return 20, 'business'
+        if domain in config.personal_domains:
+            return 5, 'personal'
+        return 0, 'unknown'
+    
     def _is_corporate_pattern(self, domain):
         """Check if domain follows corporate patterns"""
-        corporate_patterns = [
-            r'.*corp\.com$',
-            r'.*company\.com$',
-            r'.*inc\.com$',
-            r'.*ltd\.com$',
-            r'.*llc\.com$',
-            r'.*group\.com$',
-            r'.*consulting\.com$',
-            r'.*solutions\.com$',
-            r'.*tech\.com$',
-            r'.*systems\.com$'
-        ]
-        
-        for pattern in corporate_patterns:
-            if re.match(pattern, domain):
-                return True
-        return False
+        return self.config.corporate_pattern.match(domain) is not None
     
     def generate_professional_challenge(self, context):
         """Generate context-appropriate security challenge"""
@@ -162,23 +240,29 @@ class ProfessionalSecurityManager:
         }
         
         return challenges.get(context['risk_level'], challenges['medium_risk'])
-    
-    def create_professional_access_token(self, context, email=None):
-        """Create a professional access token with context"""
-        token_data = {
-            'timestamp': time.time(),
-            'context_score': context['total_score'],
-            'domain_type': context['domain_type'],
-            'risk_level': context['risk_level'],
-            'email_hash': hashlib.sha256(email.encode()).hexdigest()[:16] if email else None,
-            'expires': (datetime.now() + timedelta(minutes=10)).timestamp()
-        }
-        
-        # Create secure token
-        token_string = json.dumps(token_data, sort_keys=True)
-        token_hash = hashlib.sha256(token_string.encode()).hexdigest()[:32]
-        
-        return token_hash, token_data
+
+class SecurityManagerRegistry(HotReloadRegistry):
+    """Holds the process-wide manager and swaps it when the data file changes"""
+
+    description = 'Professional security config'
+    errors = (OSError, ValueError, KeyError, TypeError, re.error)
+
+    def __init__(self, path=None, reload_interval=5.0):
+        super().__init__(path or os.environ.get('PROFESSIONAL_SECURITY_CONFIG', DEFAULT_CONFIG_PATH), reload_interval)
+
+    def load(self, path):
+        return ProfessionalSecurityManager(SecurityConfig.load(path))
+
+
+security_managers = SecurityManagerRegistry(
+    reload_interval=float(os.environ.get('PROFESSIONAL_SECURITY_RELOAD_INTERVAL', 5))
+)
+
+
+def get_security_manager():
+    """Return the shared ProfessionalSecurityManager, reloading its data file if it changed"""
+    return security_managers.get()
+
 
 class ProfessionalVerificationDecorator:
     """Decorator for professional verification"""
@@ -187,7 +271,7 @@ class ProfessionalVerificationDecorator:
     def require_professional_verification(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            security_manager = ProfessionalSecurityManager()
+            security_manager = get_security_manager()
             
             # Analyze context
             context = security_manager.analyze_professional_context(
@@ -196,8 +280,8 @@ class ProfessionalVerificationDecorator:
                 referrer=request.headers.get('Referer')
             )
             
-            # Store context in session
-            session['professional_context'] = context
+            # The session only carries the compact record of the analysis
+            session['professional_context'] = encode_verification(context)
             
             return f(*args, **kwargs)
         return decorated_function
@@ -0,0 +1,232 @@
+"""
+Shared rate limit storage backends for Flask-Limiter
+``file://`` keeps fixed-window counters in a SQLite file shared by every worker
+on a host; ``prefilter+<scheme>://`` wraps any storage (file, memory, redis,
+memcached) so most hits are admitted locally and written to the shared store
+in batches
+"""
+
+from limits.storage import Storage, storage_from_string
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+
+DEFAULT_FILE_PATH = '/tmp/reborncloud-ratelimit.db'
+
+
+class FileStorage(Storage):
+    """Fixed-window counters in a WAL-mode SQLite file, safe across processes"""
+
+    STORAGE_SCHEME = ['file']
+    CLEANUP_EVERY = 1024
+
+    def __init__(self, uri=None, wrap_exceptions=False, **options):
+        parsed = urllib.parse.urlparse(uri or 'file://')
+        self.path = parsed.path or DEFAULT_FILE_PATH
+        self.timeout = float(options.pop('timeout', 1.0))
+        self._local = threading.local()
+        self._writes = 0
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    def _connection(self):
+        # Connections are per thread and per process so nothing opened in the
+        # gunicorn master before --preload forks is ever reused by a worker
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=OFF')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS counters '
+                '(key TEXT PRIMARY KEY, count INTEGER NOT NULL, expires REAL NOT NULL)'
+            )
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def incr(self, key, expiry, elastic_expiry=False, amount=1):
+        now = time.time()
+        row = self._connection().execute(
+            'INSERT INTO counters (key, count, expires) VALUES (?, ?, ?) '
+            'ON CONFLICT(key) DO UPDATE SET '
+            'count = CASE WHEN expires <= ? THEN excluded.count ELSE count + excluded.count END, '
+            'expires = CASE WHEN expires <= ? OR ? THEN excluded.expires ELSE expires END '
+            'RETURNING count',
+            (key, amount, now + expiry, now, now, bool(elastic_expiry))
+        ).fetchone()
+
+        self._writes += 1
+        if self._writes % self.CLEANUP_EVERY == 0:
+            self._connection().execute('DELETE FROM counters WHERE expires <= ?', (now,))
+        return row[0]
+
+    def get(self, key):
+        row = self._connection().execute(
+            'SELECT count FROM counters WHERE key = ? AND expires > ?', (key, time.time())
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key):
+        row = self._connection().execute(
+            'SELECT expires FROM counters WHERE key = ? AND expires > ?', (key, time.time())
+        ).fetchone()
+        return row[0] if row else time.time()
+
+    def check(self):
+        try:
+            self._connection().execute('SELECT 1').fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self):
+        return self._connection().execute('DELETE FROM counters').rowcount
+
+    def clear(self, key):
+        self._connection().execute('DELETE FROM counters WHERE key = ?', (key,))
+
+
+class _Lease:
+    __slots__ = ('count', 'written', 'pending', 'allowance', 'synced_at', 'expires')
+
+    def __init__(self, count, written, pending, allowance, synced_at, expires):
+        self.count = count
+        self.written = written
+        self.pending = pending
+        self.allowance = allowance
+        self.synced_at = synced_at
+        self.expires = expires
+
+
+class PrefilteredStorage(Storage):
+    """Admits clearly-under-limit hits locally and writes them to the shared counter in batches
+
+    Each sync writes the hits admitted since the last one plus the current
+    hit, and sizes the next local allowance from what remains and this
+    worker's share of the window's count. Nothing is reserved, so unused
+    allowance never counts against anyone and the number of workers or tasks
+    sharing the store needs no configuration. The limit can be overshot by
+    hits admitted but not yet written; allowances shrink to zero as a window
+    nears its limit, and pending hits are written at least every
+    SYNC_INTERVAL seconds.
+    """
+
+    STORAGE_SCHEME = ['prefilter+file', 'prefilter+memory', 'prefilter+redis', 'prefilter+memcached']
+    SYNC_INTERVAL = 1.0
+    MAX_LEASES = 4096
+
+    def __init__(self, uri=None, wrap_exceptions=False, **options):
+        self.storage = storage_from_string(uri.split('+', 1)[1], **options)
+        self.local_hits = 0
+        self.shared_syncs = 0
+        self._leases = {}
+        self._flushed_at = time.time()
+        self._lock = threading.Lock()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+
+    @property
+    def base_exceptions(self):
+        return self.storage.base_exceptions
+
+    @staticmethod
+    def _limit_amount(key):
+        # limits keys end in "<amount>/<multiples>/<granularity>"
+        try:
+            return int(key.rsplit('/', 3)[1])
+        except (IndexError, ValueError):
+            return None
+
+    def incr(self, key, expiry, elastic_expiry=False, amount=1):
+        limit = self._limit_amount(key)
+        if limit is None or elastic_expiry:
+            return self.storage.incr(key, expiry, amount=amount)
+
+        now = time.time()
+        if now - self._flushed_at >= self.SYNC_INTERVAL:
+            self.flush()
+        with self._lock:
+            lease = self._leases.get(key)
+            if lease is None or lease.expires <= now:
+                pending, previous, written = 0, None, 0
+            elif lease.pending + amount <= lease.allowance and now - lease.synced_at < self.SYNC_INTERVAL:
+                lease.pending += amount
+                self.local_hits += 1
+                return lease.count + lease.pending
+            else:
+                # Claim the pending hits; concurrent threads sync on their own until the new lease lands
+                pending, previous, written = lease.pending, lease.count, lease.written
+                lease.pending = lease.allowance = 0
+
+        count = self.storage.incr(key, expiry, amount=pending + amount)
+        if previous is None or count - previous < pending + amount:
+            # A new window: no traffic share to size an allowance from yet
+            written, allowance = pending + amount, 0
+        else:
+            # A quarter of this worker's share of what remains, and never more
+            # than it has written this window, so one early burst cannot
+            # leave a large lease behind
+            written += pending + amount
+            allowance = min(written, int(max(0, limit - count) * written / count) // 4)
+        expires = self.storage.get_expiry(key) if allowance else now + expiry
+
+        with self._lock:
+            self.shared_syncs += 1
+            current = self._leases.get(key)
+            carried = current.pending if current is not None and current.expires > now else 0
+            self._leases[key] = _Lease(count, written, carried, allowance + carried, now, expires)
+            if len(self._leases) > self.MAX_LEASES:
+                for stale in [k for k, v in self._leases.items() if v.expires <= now]:
+                    del self._leases[stale]
+        return count
+
+    def flush(self):
+        """Write the pending hits of leases that have not synced for SYNC_INTERVAL"""
+        now = time.time()
+        batch = []
+        with self._lock:
+            self._flushed_at = now
+            for key, lease in self._leases.items():
+                if lease.pending and lease.expires > now and now - lease.synced_at >= self.SYNC_INTERVAL:
+                    batch.append((key, lease.pending, lease.expires - now))
+                    lease.count += lease.pending
+                    lease.written += lease.pending
+                    lease.pending = lease.allowance = 0
+        for key, pending, expiry in batch:
+            self.storage.incr(key, max(1, int(expiry)), amount=pending)
+
+    def get(self, key):
+        # Other workers' pending hits are only visible once they sync
+        with self._lock:
+            lease = self._leases.get(key)
+            pending = lease.pending if lease is not None and lease.expires > time.time() else 0
+        return self.storage.get(key) + pending
+
+    def get_expiry(self, key):
+        return self.storage.get_expiry(key)
+
+    def check(self):
+        return self.storage.check()
+
+    def reset(self):
+        with self._lock:
+            self._leases.clear()
+        return self.storage.reset()
+
+    def clear(self, key):
+        with self._lock:
+            self._leases.pop(key, None)
+        self.storage.clear(key)
+
+
+def register():
+    """Return the storage schemes this module adds to limits"""
+    # limits registers a Storage subclass's STORAGE_SCHEME when the class is
+    # defined, so importing this module is the registration; calling this
+    # keeps that import from reading as unused
+    return tuple(FileStorage.STORAGE_SCHEME + PrefilteredStorage.STORAGE_SCHEME)
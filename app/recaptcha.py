@@ -0,0 +1,239 @@
+"""
+reCAPTCHA verification client
+Pooled keep-alive HTTP session with a latency budget and a circuit breaker,
+a short-lived single-flight result cache keyed by token and client IP, and a
+local stub verifier for tests and offline development
+"""
+
+from collections import OrderedDict
+from app.metrics import metrics
+from flask import current_app
+import hashlib
+import threading
+import time
+
+VERIFY_URL = 'https://www.google.com/recaptcha/api/siteverify'
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures and lets a single trial call through after a cool-down"""
+
+    def __init__(self, threshold=5, reset_timeout=30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    def allow(self):
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.opened_at is not None or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+class _InFlight:
+    __slots__ = ('event', 'result')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+
+
+class VerificationCache:
+    """Bounded TTL memo of verification results that collapses concurrent lookups of one key"""
+
+    def __init__(self, ttl=120.0, success_ttl=5.0, max_entries=1024):
+        self.ttl = ttl
+        # Long enough to merge a double submit, too short to replay a solved token
+        self.success_ttl = success_ttl
+        self.max_entries = max_entries
+        self._results = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        """Return a cached result or run ``compute`` once; it returns (result, cacheable)"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None and cached[1] > now:
+                return cached[0]
+            pending = self._in_flight.get(key)
+            leader = pending is None
+            if leader:
+                pending = self._in_flight[key] = _InFlight()
+
+        if not leader:
+            pending.event.wait()
+            return pending.result
+
+        result, cacheable = False, False
+        try:
+            result, cacheable = compute()
+        finally:
+            with self._lock:
+                if cacheable:
+                    ttl = self.success_ttl if result else self.ttl
+                    self._results[key] = (result, time.monotonic() + ttl)
+                    self._results.move_to_end(key)
+                    while len(self._results) > self.max_entries:
+                        self._results.popitem(last=False)
+                del self._in_flight[key]
+            pending.result = result
+            pending.event.set()
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+
+class HTTPRecaptchaClient:
+    """Talks to Google's siteverify endpoint over a shared keep-alive connection pool"""
+
+    def __init__(self, url=VERIFY_URL, pool_size=8, connect_timeout=1.0, timeout=3.0):
+        self.url = url
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, timeout)
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        # requests is only imported, and the pool only built, on the first
+        # verification, keeping it off the startup path and out of the
+        # gunicorn master
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+    def siteverify(self, secret, token, remote_ip=None):
+        data = {'secret': secret, 'response': token, 'remoteip': remote_ip}
+        response = self.session.post(self.url, data=data, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+
+class StubRecaptchaClient:
+    """Local stand-in that answers without network access and records every call"""
+
+    def __init__(self, success=True, latency=0.0, failing_tokens=()):
+        self.success = success
+        self.latency = latency
+        self.failing_tokens = set(failing_tokens)
+        self.calls = []
+
+    def siteverify(self, secret, token, remote_ip=None):
+        self.calls.append((token, remote_ip))
+        if self.latency:
+            time.sleep(self.latency)
+        return {'success': self.success and token not in self.failing_tokens}
+
+
+class Recaptcha:
+    """Flask extension wrapping a verification client with a circuit breaker"""
+
+    def __init__(self, app=None):
+        self.client = None
+        self.breaker = CircuitBreaker()
+        self.results = VerificationCache()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('RECAPTCHA_VERIFIER', 'http')
+        app.config.setdefault('RECAPTCHA_POOL_SIZE', 8)
+        app.config.setdefault('RECAPTCHA_CONNECT_TIMEOUT', 1.0)
+        app.config.setdefault('RECAPTCHA_TIMEOUT', 3.0)
+        app.config.setdefault('RECAPTCHA_BREAKER_THRESHOLD', 5)
+        app.config.setdefault('RECAPTCHA_BREAKER_RESET', 30.0)
+        app.config.setdefault('RECAPTCHA_RESULT_TTL', 120.0)
+        app.config.setdefault('RECAPTCHA_SUCCESS_TTL', 5.0)
+        app.config.setdefault('RECAPTCHA_RESULT_CACHE_SIZE', 1024)
+
+        if app.config['RECAPTCHA_VERIFIER'] == 'stub':
+            self.client = StubRecaptchaClient()
+        else:
+            self.client = HTTPRecaptchaClient(
+                pool_size=app.config['RECAPTCHA_POOL_SIZE'],
+                connect_timeout=app.config['RECAPTCHA_CONNECT_TIMEOUT'],
+                timeout=app.config['RECAPTCHA_TIMEOUT']
+            )
+        self.breaker = CircuitBreaker(
+            threshold=app.config['RECAPTCHA_BREAKER_THRESHOLD'],
+            reset_timeout=app.config['RECAPTCHA_BREAKER_RESET']
+        )
+        self.results = VerificationCache(
+            ttl=app.config['RECAPTCHA_RESULT_TTL'],
+            success_ttl=app.config['RECAPTCHA_SUCCESS_TTL'],
+            max_entries=app.config['RECAPTCHA_RESULT_CACHE_SIZE']
+        )
+        app.extensions['recaptcha'] = self
+
+    @property
+    def circuit_open(self):
+        return self.breaker.state == 'open'
+
+    def verify(self, secret, token, remote_ip=None):
+        """Return True only for a successful siteverify answer within the latency budget"""
+        if not token:
+            return False
+        key = hashlib.sha256(f"{remote_ip}\0{token}".encode('utf-8')).hexdigest()
+        return self.results.get_or_compute(key, lambda: self._siteverify(secret, token, remote_ip))
+
+    def _siteverify(self, secret, token, remote_ip):
+        if not self.breaker.allow():
+            current_app.logger.warning("reCAPTCHA verification skipped: circuit open")
+            return False, False
+
+        started = time.perf_counter()
+        try:
+            result = self.client.siteverify(secret, token, remote_ip)
+        except Exception as e:
+            metrics.observe_recaptcha(time.perf_counter() - started, 'error')
+            self.breaker.record_failure()
+            current_app.logger.error(f"reCAPTCHA verification failed: {str(e)}")
+            return False, False
+
+        success = bool(result.get('success', False))
+        metrics.observe_recaptcha(time.perf_counter() - started, 'success' if success else 'failure')
+        self.breaker.record_success()
+        return success, True
+
+
+recaptcha = Recaptcha()
@@ -0,0 +1,198 @@
+"""
+Responsive image derivatives
+Raster images under static/images are resized to several widths in AVIF, WebP
+and JPEG, cached on disk under a name derived from the source content hash and
+listed in a manifest; templates call responsive_image() to emit a <picture>
+with srcset/sizes. Pillow is optional and only imported when a derivative is
+missing: without it an existing manifest is still used, and with neither the
+helper falls back to a plain <img>
+"""
+
+from flask import send_from_directory, url_for
+from markupsafe import Markup, escape
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+SOURCE_DIR = 'images'
+SOURCE_EXTENSIONS = ('.jpeg', '.jpg', '.png')
+DEFAULT_WIDTHS = (200, 400, 640, 800)
+# Most compact first: browsers take the first <source> whose type they support
+FORMATS = (
+    ('avif', 'image/avif', {'quality': 50}),
+    ('webp', 'image/webp', {'quality': 75, 'method': 6}),
+    ('jpeg', 'image/jpeg', {'quality': 80, 'optimize': True, 'progressive': True}),
+)
+IMMUTABLE_MAX_AGE = 31536000
+
+
+def _load_pillow():
+    try:
+        from PIL import Image, features
+    except ImportError:
+        return None, None
+    return Image, features
+
+
+class ResponsiveImages:
+    """Builds, indexes and serves resized image variants"""
+
+    def __init__(self, app=None):
+        self.source_dir = None
+        self.output_dir = None
+        self.widths = DEFAULT_WIDTHS
+        self.images = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('RESPONSIVE_IMAGES_ENABLED', True)
+        app.config.setdefault('RESPONSIVE_IMAGE_DIR', '')
+        app.config.setdefault('RESPONSIVE_IMAGE_WIDTHS', DEFAULT_WIDTHS)
+
+        self.source_dir = os.path.join(app.static_folder, SOURCE_DIR)
+        self.output_dir = app.config['RESPONSIVE_IMAGE_DIR'] or os.path.join(app.root_path, 'static-dist', 'responsive')
+        self.widths = tuple(sorted(int(width) for width in app.config['RESPONSIVE_IMAGE_WIDTHS']))
+
+        @app.cli.command('build-images')
+        def build_images_command():
+            """Generate responsive image derivatives."""
+            if _load_pillow()[0] is None:
+                raise SystemExit("Pillow is required to build image derivatives")
+            self.build()
+            variants = sum(len(v) for image in self.images.values() for v in image['variants'].values())
+            print(f"Built {variants} derivatives of {len(self.images)} images into {self.output_dir}")
+
+        app.add_url_rule('/static/responsive/<path:filename>', 'responsive_image', self.send_image)
+        app.add_template_global(self.responsive_image)
+        app.extensions['responsive_images'] = self
+
+        if not app.config['RESPONSIVE_IMAGES_ENABLED']:
+            return
+        try:
+            self.build()
+        except OSError as e:
+            app.logger.warning(f"Responsive images unavailable: {str(e)}")
+            self.images = {}
+
+    def _sources(self):
+        if not os.path.isdir(self.source_dir):
+            return
+        for name in sorted(os.listdir(self.source_dir)):
+            if name.lower().endswith(SOURCE_EXTENSIONS):
+                yield f"{SOURCE_DIR}/{name}", os.path.join(self.source_dir, name)
+
+    def _load_manifest(self):
+        try:
+            with open(os.path.join(self.output_dir, MANIFEST_NAME), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != MANIFEST_VERSION or manifest.get('widths') != list(self.widths):
+            return {}
+        return manifest.get('images', {})
+
+    def _is_complete(self, entry, digest):
+        return entry is not None and entry['hash'] == digest and all(
+            os.path.exists(os.path.join(self.output_dir, name))
+            for variants in entry['variants'].values() for _, name in variants
+        )
+
+    def build(self):
+        """Generate missing derivatives, reusing manifest entries whose source hash is unchanged"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        previous = self._load_manifest()
+        images = {}
+        for filename, path in self._sources():
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()[:12]
+            entry = previous.get(filename)
+            if self._is_complete(entry, digest):
+                images[filename] = entry
+                continue
+            Image, features = _load_pillow()
+            if Image is None:
+                continue
+            with Image.open(path) as source:
+                source.load()
+                images[filename] = self._build_image(filename, source, digest, Image, features)
+
+        if images != previous:
+            manifest = {'version': MANIFEST_VERSION, 'widths': list(self.widths), 'images': images}
+            self._write(os.path.join(self.output_dir, MANIFEST_NAME),
+                        json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+        self.images = images
+
+    def _build_image(self, filename, source, digest, Image, features):
+        width, height = source.size
+        widths = sorted({w for w in self.widths if w < width} | {min(width, self.widths[-1])})
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        rgb = source.convert('RGB') if source.mode not in ('RGB', 'L') else source
+
+        variants = {}
+        for fmt, _, options in FORMATS:
+            if fmt != 'jpeg' and not features.check(fmt):
+                continue
+            variants[fmt] = []
+            for target_width in widths:
+                name = f"{stem}.{digest}.{target_width}w.{fmt}"
+                path = os.path.join(self.output_dir, name)
+                if not os.path.exists(path):
+                    target_height = round(height * target_width / width)
+                    resized = rgb if target_width == width else rgb.resize((target_width, target_height), Image.LANCZOS)
+                    temp = f"{path}.{os.getpid()}.tmp"
+                    resized.save(temp, format=fmt.upper(), **options)
+                    os.replace(temp, path)
+                variants[fmt].append([target_width, name])
+
+        return {'hash': digest, 'width': width, 'height': height, 'variants': variants}
+
+    def _write(self, path, data):
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, 'wb') as f:
+            f.write(data)
+        os.replace(temp, path)
+
+    def send_image(self, filename):
+        return send_from_directory(self.output_dir, filename, max_age=IMMUTABLE_MAX_AGE)
+
+    def srcset(self, src, fmt='jpeg'):
+        """The srcset attribute value for one format of a static image, or '' if none was built"""
+        image = self.images.get(src)
+        if image is None or fmt not in image['variants']:
+            return ''
+        return ', '.join(
+            f"{url_for('responsive_image', filename=name)} {width}w"
+            for width, name in image['variants'][fmt]
+        )
+
+    def responsive_image(self, src, alt='', sizes='100vw', **attrs):
+        """Render a <picture> for a static image, falling back to a plain <img>"""
+        attrs.setdefault('loading', 'lazy')
+        attrs.setdefault('decoding', 'async')
+        image = self.images.get(src)
+        img_attrs = {'src': url_for('static', filename=src), 'alt': alt}
+        if image is not None:
+            img_attrs.update(width=image['width'], height=image['height'])
+        img_attrs.update(attrs)
+
+        sources = []
+        if image is not None:
+            for fmt, mimetype, _ in FORMATS:
+                srcset = self.srcset(src, fmt)
+                if not srcset:
+                    continue
+                if fmt == 'jpeg':
+                    img_attrs.update(srcset=srcset, sizes=sizes)
+                else:
+                    sources.append(f'<source type="{mimetype}" srcset="{escape(srcset)}" sizes="{escape(sizes)}">')
+
+        img = '<img ' + ' '.join(f'{key}="{escape(value)}"' for key, value in img_attrs.items()) + '>'
+        if not sources:
+            return Markup(img)
+        return Markup('<picture>' + ''.join(sources) + img + '</picture>')
+
+
+responsive_images = ResponsiveImages()
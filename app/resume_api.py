@@ -0,0 +1,94 @@
+"""
+Pre-serialised payloads for the /api/resume endpoint
+Each field projection is serialised and compressed once per content version
+"""
+
+from collections import OrderedDict
+from flask import current_app, request
+import gzip
+import hashlib
+import threading
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MIN_COMPRESS_SIZE = 256
+ENCODING_PREFERENCE = ('br', 'gzip', 'identity')
+
+
+class Payload:
+    """One serialised projection of the resume document in every stored encoding"""
+
+    __slots__ = ('bodies', 'etag')
+
+    def __init__(self, body):
+        self.etag = hashlib.sha256(body).hexdigest()
+        self.bodies = {'identity': body}
+        if len(body) >= MIN_COMPRESS_SIZE:
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                self.bodies['gzip'] = compressed
+            if brotli is not None:
+                compressed = brotli.compress(body, quality=11)
+                if len(compressed) < len(body):
+                    self.bodies['br'] = compressed
+
+
+class PayloadCache:
+    """Bounded LRU of serialised projections, dropped wholesale on content change"""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def get(self, data, version, fields=None):
+        """Return the payload for ``fields`` (top-level keys), raising KeyError on unknown fields"""
+        key = tuple(sorted(set(fields))) if fields else None
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                return payload
+
+        if key is None:
+            document = dict(data)
+        else:
+            unknown = [field for field in key if field not in data]
+            if unknown:
+                raise KeyError(', '.join(unknown))
+            document = {field: data[field] for field in key}
+        payload = Payload(f"{current_app.json.dumps(document)}\n".encode('utf-8'))
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = payload
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return payload
+
+
+def payload_response(payload, last_modified=None):
+    """Build a conditional JSON response using the best encoding the client accepts"""
+    offered = [encoding for encoding in ENCODING_PREFERENCE if encoding in payload.bodies]
+    encoding = request.accept_encodings.best_match(offered, default='identity')
+
+    response = current_app.response_class(payload.bodies[encoding], mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    if encoding != 'identity':
+        response.content_encoding = encoding
+        response.set_etag(f"{payload.etag}-{encoding}")
+    else:
+        response.set_etag(payload.etag)
+    if last_modified:
+        response.last_modified = int(last_modified)
+    return response.make_conditional(request)
+
+
+resume_payloads = PayloadCache()
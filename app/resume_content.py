@@ -0,0 +1,246 @@
+"""
+Resume content model
+app/data/resume.json is the single source of truth for the portfolio content.
+It is validated against a strict schema and compiled into frozen, slotted
+objects together with everything derived from it (the API document and the
+content version); the registry swaps in a new model when the file changes
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import ClassVar
+from app.hot_reload import HotReloadRegistry
+import hashlib
+import json
+import os
+import time
+
+DEFAULT_CONTENT_PATH = os.path.join(os.path.dirname(__file__), 'data', 'resume.json')
+
+
+class ResumeDataError(ValueError):
+    """The resume data file does not match the schema"""
+
+
+def _compile(kind, value, path):
+    if isinstance(kind, list):
+        if not isinstance(value, list):
+            raise ResumeDataError(f"{path}: expected a list")
+        return tuple(_compile(kind[0], item, f"{path}[{i}]") for i, item in enumerate(value))
+    if hasattr(kind, 'SCHEMA'):
+        return kind.from_dict(value, path)
+    if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+        raise ResumeDataError(f"{path}: expected {kind.__name__}, got {type(value).__name__}")
+    return value
+
+
+def _compile_fields(cls, data, path):
+    if not isinstance(data, dict):
+        raise ResumeDataError(f"{path}: expected an object")
+    unknown = sorted(set(data) - set(cls.SCHEMA))
+    if unknown:
+        raise ResumeDataError(f"{path}: unknown field(s) {', '.join(unknown)}")
+    values = {}
+    for name, kind in cls.SCHEMA.items():
+        if name in data:
+            values[name] = _compile(kind, data[name], f"{path}.{name}")
+        elif name not in cls.OPTIONAL:
+            raise ResumeDataError(f"{path}.{name}: required field missing")
+    return values
+
+
+class _Record:
+    """Schema-driven construction shared by the content classes"""
+
+    __slots__ = ()
+    OPTIONAL: ClassVar[frozenset] = frozenset()
+
+    @classmethod
+    def from_dict(cls, data, path):
+        return cls(**_compile_fields(cls, data, path))
+
+
+@dataclass(frozen=True, slots=True)
+class PersonalInfo(_Record):
+    SCHEMA: ClassVar[dict] = {
+        'name': str, 'title': str, 'email': str, 'alternate_email': str, 'phone': str,
+        'alternate_phone': str, 'location': str, 'website': str, 'github': str,
+        'linkedin': str, 'medium': str, 'profile_image': str
+    }
+    OPTIONAL: ClassVar[frozenset] = frozenset({'alternate_email', 'alternate_phone', 'medium'})
+
+    name: str
+    title: str
+    email: str
+    phone: str
+    location: str
+    website: str
+    github: str
+    linkedin: str
+    profile_image: str
+    medium: str = None
+    alternate_email: str = None
+    alternate_phone: str = None
+
+
+@dataclass(frozen=True, slots=True)
+class Experience(_Record):
+    SCHEMA: ClassVar[dict] = {
+        'position': str, 'company': str, 'location': str, 'duration': str, 'description': str,
+        'responsibilities': [str], 'projects': [str], 'technologies': [str]
+    }
+    OPTIONAL: ClassVar[frozenset] = frozenset({'description', 'responsibilities', 'projects', 'technologies'})
+
+    position: str
+    company: str
+    location: str
+    duration: str
+    description: str = None
+    responsibilities: tuple = ()
+    projects: tuple = ()
+    technologies: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class SkillCategory(_Record):
+    SCHEMA: ClassVar[dict] = {'name': str, 'icon': str, 'skills': [str]}
+
+    name: str
+    icon: str
+    skills: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Education(_Record):
+    SCHEMA: ClassVar[dict] = {
+        'degree': str, 'institution': str, 'location': str, 'grade': str, 'relevant_courses': [str]
+    }
+    OPTIONAL: ClassVar[frozenset] = frozenset({'grade', 'relevant_courses'})
+
+    degree: str
+    institution: str
+    location: str
+    grade: str = None
+    relevant_courses: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Certification(_Record):
+    SCHEMA: ClassVar[dict] = {
+        'name': str, 'issuer': str, 'issued': str, 'code': str, 'icon': str, 'status': str
+    }
+    OPTIONAL: ClassVar[frozenset] = frozenset({'issued', 'code', 'status'})
+
+    name: str
+    issuer: str
+    icon: str
+    issued: str = None
+    code: str = None
+    status: str = None
+
+
+@dataclass(frozen=True, slots=True)
+class Project(_Record):
+    SCHEMA: ClassVar[dict] = {'name': str, 'description': str, 'technologies': [str], 'highlights': [str]}
+
+    name: str
+    description: str
+    technologies: tuple
+    highlights: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Stats(_Record):
+    SCHEMA: ClassVar[dict] = {
+        'years_experience': str, 'certifications': int, 'uptime_achieved': str,
+        'support_hours': str, 'projects_completed': str, 'cost_savings': str
+    }
+
+    years_experience: str
+    certifications: int
+    uptime_achieved: str
+    support_hours: str
+    projects_completed: str
+    cost_savings: str
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioImage(_Record):
+    SCHEMA: ClassVar[dict] = {'src': str, 'alt': str, 'title': str}
+
+    src: str
+    alt: str
+    title: str
+
+
+@dataclass(frozen=True, slots=True)
+class Resume:
+    """The compiled resume; ``skills`` is a read-only mapping of category name to SkillCategory"""
+
+    SCHEMA: ClassVar[dict] = {
+        'personal_info': PersonalInfo, 'bio': str, 'experience': [Experience], 'skills': dict,
+        'education': [Education], 'certifications': [Certification], 'projects': [Project],
+        'stats': Stats, 'languages': [str], 'interests': [str], 'portfolio_images': [PortfolioImage]
+    }
+    OPTIONAL: ClassVar[frozenset] = frozenset()
+
+    personal_info: PersonalInfo
+    bio: str
+    experience: tuple
+    skills: MappingProxyType
+    education: tuple
+    certifications: tuple
+    projects: tuple
+    stats: Stats
+    languages: tuple
+    interests: tuple
+    portfolio_images: tuple
+    # Derived at load time
+    document: MappingProxyType
+    version: str
+    modified: float
+
+    @classmethod
+    def from_dict(cls, data, modified=None):
+        values = _compile_fields(cls, data, 'resume')
+        skills = {}
+        for name, category in data['skills'].items():
+            if not isinstance(category, dict):
+                raise ResumeDataError(f"resume.skills.{name}: expected an object")
+            skills[name] = SkillCategory.from_dict(dict(category, name=name), f"resume.skills.{name}")
+        values['skills'] = MappingProxyType(skills)
+        canonical = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return cls(
+            document=MappingProxyType(json.loads(canonical)),
+            version=hashlib.sha256(canonical.encode('utf-8')).hexdigest(),
+            modified=time.time() if modified is None else modified,
+            **values
+        )
+
+    @classmethod
+    def load(cls, path=DEFAULT_CONTENT_PATH):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls.from_dict(data, modified=os.path.getmtime(path))
+
+
+class ResumeContentRegistry(HotReloadRegistry):
+    """Holds the current Resume and atomically replaces it when the data file changes"""
+
+    description = 'Resume data'
+
+    def __init__(self, path=None, reload_interval=2.0):
+        super().__init__(path or os.environ.get('RESUME_DATA_FILE', DEFAULT_CONTENT_PATH), reload_interval)
+
+    def load(self, path):
+        return Resume.load(path)
+
+
+resume_content = ResumeContentRegistry(
+    reload_interval=float(os.environ.get('RESUME_DATA_RELOAD_INTERVAL', 2))
+)
+
+
+def get_resume():
+    """Return the current compiled Resume, reloading its data file if it changed"""
+    return resume_content.get()
@@ -0,0 +1,114 @@
+"""
+Resume PDF delivery
+File metadata and content hash are loaded once at startup; downloads are
+streamed through wsgi.file_wrapper (sendfile under gunicorn) with Range and
+If-Range support, or handed off to a fronting proxy via X-Accel-Redirect or
+X-Sendfile
+"""
+
+from flask import current_app, request
+from werkzeug.wsgi import wrap_file
+import hashlib
+import os
+import threading
+
+RESUME_FILENAME = 'Elson-Ealias-Resume-2025.pdf'
+OFFLOAD_MODES = ('', 'x-accel-redirect', 'x-sendfile')
+
+
+class ResumeFile:
+    """A static download whose size, mtime and ETag are known ahead of requests"""
+
+    def __init__(self, app=None):
+        self.path = None
+        self.size = None
+        self.mtime = None
+        self.etag = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('RESUME_OFFLOAD', '')
+        app.config.setdefault('RESUME_ACCEL_PREFIX', '/protected/documents')
+        if app.config['RESUME_OFFLOAD'] not in OFFLOAD_MODES:
+            raise ValueError(f"RESUME_OFFLOAD must be one of {OFFLOAD_MODES}")
+
+        self.path = os.path.join(app.static_folder, 'documents', RESUME_FILENAME)
+        try:
+            with open(self.path, 'rb') as f:
+                self._load(f)
+        except OSError as e:
+            app.logger.warning(f"Resume file unavailable at startup: {str(e)}")
+
+    @property
+    def available(self):
+        return self.etag is not None
+
+    def _load(self, f):
+        stat = os.fstat(f.fileno())
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+        f.seek(0)
+        self.size, self.mtime, self.etag = stat.st_size, stat.st_mtime, digest.hexdigest()
+
+    def is_resumption(self, request):
+        """Whether the request asks for a single range that excludes byte 0 and will be honoured.
+
+        Anything else, including a failed If-Range, suffix ranges and
+        ``bytes=0-``, can return the start of the file
+        """
+        ranges = request.range
+        if ranges is None or ranges.units != 'bytes' or len(ranges.ranges) != 1:
+            return False
+        start, _ = ranges.ranges[0]
+        if start <= 0:
+            return False
+        if_range = request.if_range
+        if if_range.etag is not None:
+            return if_range.etag == self.etag
+        if if_range.date is not None:
+            return self.mtime is not None and int(self.mtime) <= if_range.date.timestamp()
+        return True
+
+    def make_response(self, download_name=RESUME_FILENAME):
+        """Build the download response; raises OSError if the file is missing"""
+        offload = current_app.config['RESUME_OFFLOAD']
+        if offload:
+            if not self.available:
+                raise FileNotFoundError(self.path)
+            response = current_app.response_class(mimetype='application/pdf')
+            if offload == 'x-sendfile':
+                response.headers['X-Sendfile'] = self.path
+            else:
+                response.headers['X-Accel-Redirect'] = f"{current_app.config['RESUME_ACCEL_PREFIX']}/{RESUME_FILENAME}"
+        else:
+            f = open(self.path, 'rb')
+            try:
+                stat = os.fstat(f.fileno())
+                if (stat.st_size, stat.st_mtime) != (self.size, self.mtime):
+                    with self._lock:
+                        self._load(f)
+            except Exception:
+                f.close()
+                raise
+            response = current_app.response_class(
+                wrap_file(request.environ, f),
+                mimetype='application/pdf',
+                direct_passthrough=True
+            )
+            response.content_length = self.size
+            response.accept_ranges = 'bytes'
+
+        response.headers['Content-Disposition'] = f'attachment; filename="{download_name}"'
+        response.set_etag(self.etag)
+        response.last_modified = int(self.mtime)
+        response.cache_control.private = True
+        response.cache_control.max_age = current_app.get_send_file_max_age(RESUME_FILENAME)
+        if offload:
+            return response
+        return response.make_conditional(request, accept_ranges=True, complete_length=self.size)
+
+
+resume_file = ResumeFile()
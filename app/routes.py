@@ -1,333 +1,92 @@
-from flask import Blueprint, render_template, jsonify, send_file, current_app, request, session, flash, redirect, url_for
+from flask import Blueprint, jsonify, current_app, request, flash, redirect, url_for
 from app import limiter
-from datetime import datetime
-import os
-import requests
-import secrets
-import time
+from app.audit_log import audit_log
+from app.page_cache import page_cache
+from app.download_tokens import download_tokens
+from app.health import LIVENESS_BODY, VERSION, readiness
+from app.metrics import metrics
+from app.recaptcha import recaptcha
+from app.resume_content import get_resume, resume_content
+from app.resume_file import resume_file
+from app.resume_api import resume_payloads, payload_response
+from app.view_models import view_models
 
 main = Blueprint('main', __name__)
 
-RESUME_DATA = {
-    "personal_info": {
-        "name": "Elson Pulickeel Ealias",
-        "title": "Cloud Engineer | DevOps Engineer | SRE",
-        "email": "elsonpulikkan@gmail.com", "admin@elsondevops.cloud",
-        "phone": "+91 9562385469","+91 8921754319",
-        "location": "Pulickeel House, Pazhoor P.O, Piravom, Kerala India. Pin:686664",
-        "website": "https://elsondevops.cloud/",
-        "github": "https://github.com/elsonpulikkan96",
-        "linkedin": "https://linkedin.com/in/elsondevops",
-        "medium": "https://medium.com/@elsonpulikkan",
-        "profile_image": "images/elson-cloud.jpeg"
-    },
-    "bio": "CloudOps and DevOps Engineer with 5+ years of experience managing high-availability cloud infrastructure on AWS, Kubernetes and Linux + Cloud-Native systems. Delivering Scalable and Reliable solutions through CI/CD Automation, Robust Monitoring and Adherence to SLI/SLO/SLA targets. Certified in CKA and AWS SAA with a proven track record of 24/7*365 Production Support and Enterprise-grade service delivery.",
-    "experience": [
-        {
-            "position": "Cloud Operation Engineer - 2",
-            "company": "EPI-USE India Pvt Ltd",
-            "location": "Kochi, India",
-            "duration": "10/2024 – 09/2025",
-            "description": "Managing Uptime, High Availability of SAP S/4HANA infrastructure on AWS for large-scale enterprise clients.",
-            "responsibilities": [
-                "Managed Uptime, High Availability of SAP S/4HANA infrastructure on AWS for large-scale enterprise clients",
-                "Automated recurring cloud operations using AWS Lambda, Ansible and GitHub workflows as AWS Partner-Led Support",
-                "Provide end-to-end Incident management and RCA for SAP environments on AWS",
-                "Created AWS cost optimization reports using SMC Pricing Calculator",
-                "Collaborated with SAP Basis and AWS Billing teams to streamline deployment pipelines and maintenance workflows"
-            ],
-            "projects": [
-                "City of Palo Alto (COPA): Migrated SAP S/4HANA workloads from on-premise to AWS",
-                "Automated monthly patching tasks across Dev, QA and prod environments",
-                "Prepared cost optimization and estimation reports using the AWS Pricing Calculator (SMC)",
-                "Collaborated with AWS Partner-Led Support to Reduce downtime and improve reliability"
-            ],
-            "technologies": ["AWS", "SAP S/4HANA", "Lambda", "Ansible", "GitHub Actions", "SMC Pricing Calculator"]
-        },
-        {
-            "position": "System Engineer - Contract",
-            "company": "Tata Consultancy Services (TCS)",
-            "location": "Kochi, India",
-            "duration": "04/2024 – 06/2024",
-            "description": "Designed cloud infrastructure environments with OU-Based, AWS Landing Zone method and AWS Well-Architected framework.",
-            "responsibilities": [
-                "Designed cloud infrastructure environments with OU-Based, AWS Landing Zone method and AWS Well-Architected framework",
-                "Extensive hands-on experience in automating processes through AWS Lambda, Bash scripts",
-                "Infrastructure as Code (IaC) and CI/CD pipelines, leveraging DevOps tools"
-            ],
-            "projects": [
-                "Contributed to the design and migration of AWS cloud infrastructure for LGC Life Sciences, UK",
-                "Facilitated application deployment on Apache Tomcat and Node.JS"
-            ],
-            "technologies": ["AWS", "Lambda", "Bash", "IaC", "CI/CD", "Apache Tomcat", "Node.JS"]
-        },
-        {
-            "position": "Site Reliability Engineer - Cloud",
-            "company": "Network Redux LLC",
-            "location": "Kochi, India",
-            "duration": "06/2022 – 02/2024",
-            "description": "Managed Cloud infrastructure for global tier clients on AWS and Azure, Handling daily operations in 24/7*365 Rotational shifts.",
-            "responsibilities": [
-                "Managed Cloud infrastructure for global tier clients on AWS and Azure, Handling daily operations in 24/7*365 Rotational shifts",
-                "Set-up monitoring and maintained DR for Linux and Windows servers",
-                "Worked extensively with AWS services including EC2, RDS, VPC, ELB, Cloudfront, Auto Scaling, S3, Lambda, IAM and CloudWatch, CloudTrial",
-                "Automated tasks using Bash scripts and configuration tools like Ansible"
-            ],
-            "projects": [
-                "Supported cloud operations for Phobs Inc and Intervision a leading European hotel booking platform",
-                "Helped design scalable cloud architecture for Central-Data, a U.S.-based e-commerce company"
-            ],
-            "technologies": ["AWS", "Azure", "EC2", "RDS", "VPC", "ELB", "CloudFront", "S3", "Lambda", "IAM", "CloudWatch", "Ansible", "Bash"]
-        },
-        {
-            "position": "Hosting Product Specialist – Linux and Windows",
-            "company": "Endurance International (Newfold Inc)",
-            "location": "Bengaluru, India",
-            "duration": "07/2021 – 05/2022",
-            "description": "Provided advanced support for reseller and retail hosting platforms (cPanel, Plesk, WHM).",
-            "responsibilities": [
-                "Provided advanced support for reseller and retail hosting platforms (cPanel, Plesk, WHM)",
-                "Tuned Apache2, Nginx, PHP-FPM and MySQL for optimized performance on shared, VPS and Dedicated servers",
-                "Troubleshot enterprise-level email hosting, storage, DNS, and SSL configurations"
-            ],
-            "projects": [
-                "Wholesale website hosting for ResellerClub, HostGator",
-                "Retail website and email hosting support for Hostinger"
-            ],
-            "technologies": ["cPanel", "Plesk", "WHM", "Apache2", "Nginx", "PHP-FPM", "MySQL", "DNS", "SSL"]
-        },
-        {
-            "position": "Jr. System Engineer",
-            "company": "Admod Solutions",
-            "location": "Kochi, India",
-            "duration": "09/2020 – 05/2021",
-            "description": "Monitoring, Ensured 99.9% uptime, Delivered Technical support for web-hosting clients.",
-            "responsibilities": [
-                "Monitoring, Ensured 99.9% uptime, Delivered Technical support for web-hosting clients",
-                "Resolving website issues promptly via cPanel, DirectAdmin and Plesk. Prompt escalations to L2 Engineers",
-                "Handled DNS transfers, vulnerability mitigation, and routine backup operations. Quota management via WHMCS"
-            ],
-            "projects": [
-                "Supported web hosting operations for DynoHosting and Orange Enterprise, ensuring platform stability and performance",
-                "Web-hosting support for Orange Enterprise"
-            ],
-            "technologies": ["cPanel", "DirectAdmin", "Plesk", "WHMCS", "DNS", "Linux"]
-        }
-    ],
-    "skills": {
-        "Cloud Platforms": {
-            "icon": "fas fa-cloud",
-            "skills": ["AWS (EC2, S3, RDS, Lambda, EKS, CloudFormation)", "Azure", "DigitalOcean"]
-        },
-        "Container & Orchestration": {
-            "icon": "fab fa-docker",
-            "skills": ["Kubernetes", "Docker", "Container Management"]
-        },
-        "DevOps & CI/CD": {
-            "icon": "fas fa-code-branch",
-            "skills": ["GitHub Actions", "Jenkins", "CI/CD Pipelines"]
-        },
-        "Infrastructure as Code": {
-            "icon": "fas fa-code",
-            "skills": ["Terraform", "Ansible", "CloudFormation"]
-        },
-        "Monitoring & Logging": {
-            "icon": "fas fa-chart-line",
-            "skills": ["CloudWatch", "Monitoring", "Incident Management", "Alerting"]
-        },
-        "Programming Languages": {
-            "icon": "fas fa-laptop-code",
-            "skills": ["Python", "Bash/Shell", "Automation Scripts"]
-        },
-        "Operating Systems": {
-            "icon": "fab fa-linux",
-            "skills": ["Linux Systems", "Windows Server", "Networking Fundamentals"]
-        },
-        "Web Technologies": {
-            "icon": "fas fa-globe",
-            "skills": ["Apache2", "Nginx", "PHP-FPM", "MySQL", "DNS Management"]
-        },
-        "Hosting & Management": {
-            "icon": "fas fa-server",
-            "skills": ["cPanel", "Plesk", "WHM", "DirectAdmin", "WHMCS"]
-        }
-    },
-    "education": [
-        {
-            "degree": "Bachelors in Computer Application (BCA)",
-            "institution": "Rabindranath Tagore University (AISECT)",
-            "location": "MP, India"
-        },
-        {
-            "degree": "Kerala State SSLC and HSE Computer Science",
-            "institution": "M.K.M H.S.S Piravom",
-            "location": "Ernakulam, India"
-        }
-    ],
-    "certifications": [
-        {
-            "name": "Certified Kubernetes Administrator (CKA)",
-            "issuer": "Cloud Native Computing Foundation",
-            "issued": "2025",
-            "icon": "fas fa-dharmachakra",
-            "status": "Active"
-        },
-        {
-            "name": "AWS Certified Solutions Architect Associate",
-            "issuer": "Amazon Web Services",
-            "issued": "2023",
-            "code": "SAA-C03",
-            "icon": "fab fa-aws",
-            "status": "Active"
-        },
-        {
-            "name": "RedHat based Linux server Administration",
-            "issuer": "Clado Solutions, Kochi",
-            "icon": "fab fa-redhat",
-            "status": "Completed"
-        },
-        {
-            "name": "Aptis – English Assessment (Level 2)",
-            "issuer": "British Council",
-            "icon": "fas fa-language",
-            "status": "Completed"
-        }
-    ],
-    "projects": [
-        {
-            "name": "SAP S/4HANA AWS Migration",
-            "description": "Migrated City of Palo Alto (COPA) SAP S/4HANA workloads from on-premise to AWS",
-            "technologies": ["AWS", "SAP S/4HANA", "Lambda", "Ansible"],
-            "highlights": [
-                "Zero-downtime migration strategy",
-                "Cost optimization using AWS Pricing Calculator",
-                "Automated patching across environments"
-            ]
-        },
-        {
-            "name": "Multi-Cloud Infrastructure Management",
-            "description": "Managed cloud infrastructure for global clients on AWS and Azure with 24/7*365 operations",
-            "technologies": ["AWS", "Azure", "CloudWatch", "Monitoring"],
-            "highlights": [
-                "99.9% uptime achievement",
-                "24/7*365 rotational shift support",
-                "Disaster recovery implementation"
-            ]
-        },
-        {
-            "name": "Enterprise Hosting Platform",
-            "description": "Provided advanced support for reseller and retail hosting platforms",
-            "technologies": ["cPanel", "Plesk", "Apache", "Nginx", "MySQL"],
-            "highlights": [
-                "Performance optimization for shared/VPS/Dedicated servers",
-                "Enterprise-level email and DNS configurations",
-                "SSL certificate management"
-            ]
-        }
-    ],
-    "stats": {
-        "years_experience": "5+",
-        "certifications": 4,
-        "uptime_achieved": "99.9%",
-        "support_hours": "24/7*365",
-        "projects_completed": "50+",
-        "cost_savings": "30%"
-    },
-    "languages": ["English (Fluent)", "Malayalam (Native)"],
-    "interests": ["Reading Fiction Novels", "Traveling", "Badminton", "EDM Music"],
-    "portfolio_images": [
-        {"src": "images/devops1.jpeg", "alt": "DevOps Infrastructure", "title": "Cloud Infrastructure Management"},
-        {"src": "images/devops2.jpeg", "alt": "Kubernetes Deployment", "title": "Container Orchestration"},
-        {"src": "images/devops3.jpeg", "alt": "CI/CD Pipeline", "title": "Automated Deployment Pipeline"}
-    ]
-}
+@page_cache.content_version(source=resume_content.path)
+def resume_data_version():
+    return get_resume().version
 
 def verify_recaptcha(recaptcha_response):
     if not current_app.config.get('RECAPTCHA_SECRET_KEY'):
         return True
     
-    secret_key = current_app.config['RECAPTCHA_SECRET_KEY']
-    verify_url = 'https://www.google.com/recaptcha/api/siteverify'
-    
-    data = {
-        'secret': secret_key,
-        'response': recaptcha_response,
-        'remoteip': request.environ.get('REMOTE_ADDR')
-    }
-    
-    try:
-        response = requests.post(verify_url, data=data, timeout=10)
-        result = response.json()
-        return result.get('success', False)
-    except Exception as e:
-        current_app.logger.error(f"reCAPTCHA verification failed: {str(e)}")
-        return False
+    return recaptcha.verify(
+        current_app.config['RECAPTCHA_SECRET_KEY'],
+        recaptcha_response,
+        request.environ.get('REMOTE_ADDR')
+    )
 
-def generate_download_token():
-    token = secrets.token_urlsafe(32)
-    session['download_token'] = token
-    session['download_token_time'] = time.time()
-    return token
+def generate_download_token(kind='standard'):
+    return download_tokens.issue(kind)
 
-def verify_download_token(token):
-    if not token or 'download_token' not in session:
-        return False
-    
-    if session.get('download_token') != token:
-        return False
-    
-    token_time = session.get('download_token_time', 0)
-    if time.time() - token_time > 300:
-        session.pop('download_token', None)
-        session.pop('download_token_time', None)
-        return False
-    
-    return True
+def verify_download_token(token, allow_consumed=False):
+    return download_tokens.verify(token, allow_consumed=allow_consumed)
 
-def log_download_attempt(ip_address, success=False, reason=""):
-    timestamp = datetime.now().isoformat()
-    log_entry = f"[{timestamp}] Resume download - IP: {ip_address}, Success: {success}, Reason: {reason}"
-    current_app.logger.info(log_entry)
+def log_download_attempt(ip_address, success=False, reason="", **fields):
+    audit_log.emit('resume_download', ip=ip_address, success=success, reason=reason, **fields)
 
 @main.route('/')
 @limiter.limit("100 per minute")
+@page_cache.cached
 def index():
-    return render_template('index.html', data=RESUME_DATA, current_page='home')
+    return view_models.render('index.html', current_page='home')
 
 @main.route('/bio')
+@page_cache.cached
 def bio():
-    return render_template('bio.html', data=RESUME_DATA, current_page='bio')
+    return view_models.render('bio.html', current_page='bio')
 
 @main.route('/experience')
+@page_cache.cached
 def experience():
-    return render_template('experience.html', data=RESUME_DATA, current_page='experience')
+    return view_models.render('experience.html', current_page='experience')
 
 @main.route('/skills')
+@page_cache.cached
 def skills():
-    return render_template('skills.html', data=RESUME_DATA, current_page='skills')
+    return view_models.render('skills.html', current_page='skills')
 
 @main.route('/education')
+@page_cache.cached
 def education():
-    return render_template('education.html', data=RESUME_DATA, current_page='education')
+    return view_models.render('education.html', current_page='education')
 
 @main.route('/contact')
+@page_cache.cached
 def contact():
-    return render_template('contact.html', data=RESUME_DATA, current_page='contact')
+    return view_models.render('contact.html', current_page='contact')
 
 @main.route('/projects')
+@page_cache.cached
 def projects():
-    return render_template('projects.html', data=RESUME_DATA, current_page='projects')
+    return view_models.render('projects.html', current_page='projects')
 
 @main.route('/api/resume')
 def api_resume():
-    return jsonify(RESUME_DATA)
+    fields = [field.strip() for field in request.args.get('fields', '').split(',') if field.strip()]
+    try:
+        payload = resume_payloads.get(get_resume().document, page_cache.current_content_version(), fields)
+    except KeyError as e:
+        return jsonify({"error": f"Unknown field(s): {e.args[0]}"}), 400
+    return payload_response(payload, last_modified=page_cache.content_modified)
 
 @main.route('/resume-access')
+@page_cache.cached
 def resume_access():
-    return render_template('resume_access.html', 
-                         data=RESUME_DATA,
-                         recaptcha_site_key=current_app.config.get('RECAPTCHA_SITE_KEY'),
-                         current_page='resume')
+    return view_models.render('resume_access.html',
+                              recaptcha_site_key=current_app.config.get('RECAPTCHA_SITE_KEY'),
+                              current_page='resume')
 
 @main.route('/verify-access', methods=['POST'])
 @limiter.limit("10 per minute")
@@ -381,21 +140,23 @@ def download_resume():
     token = request.args.get('token')
     
     try:
-        if not verify_download_token(token):
+        # Any GET that can include byte 0 consumes the token; a Range
+        # request that skips it may resume an interrupted download with an
+        # already consumed token until the token expires. HEAD (link
+        # previewers, download managers sizing the file) sends no body, so it
+        # only checks the token
+        resuming = resume_file.is_resumption(request)
+        probing = request.method == 'HEAD'
+        claims = verify_download_token(token, allow_consumed=resuming)
+        if not claims or not (resuming or probing or download_tokens.consume(claims)):
             log_download_attempt(ip_address, False, "Invalid or expired token")
             flash('Please verify access to download.', 'error')
             return redirect(url_for('main.resume_access'))
         
-        session.pop('download_token', None)
-        session.pop('download_token_time', None)
-        
-        pdf_path = os.path.join(current_app.static_folder, 'documents', 'Elson-Ealias-Resume-2025.pdf')
-        if os.path.exists(pdf_path):
-            log_download_attempt(ip_address, True, "File downloaded successfully")
-            return send_file(pdf_path, 
-                           as_attachment=True, 
-                           download_name='Elson-Ealias-Resume-2025.pdf', 
-                           mimetype='application/pdf')
+        if resume_file.available:
+            if not probing:
+                log_download_attempt(ip_address, True, "File downloaded successfully")
+            return resume_file.make_response(download_name='Elson-Ealias-Resume-2025.pdf')
         else:
             log_download_attempt(ip_address, False, "Resume file not found")
             return jsonify({"error": "Resume file not found"}), 404
@@ -413,21 +174,27 @@ def download_resume_legacy():
 @main.route('/health')
 @limiter.exempt
 def health_check():
+    return current_app.response_class(LIVENESS_BODY, mimetype='application/json')
+
+@main.route('/ready')
+@limiter.exempt
+def readiness_check():
+    ready, checks = readiness.status()
     return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "2.0.0",
-        "components": {
-            "database": "healthy",
-            "cache": "healthy",
-            "external_apis": "healthy"
-        }
-    })
+        "status": "ready" if ready else "not_ready",
+        "version": VERSION,
+        "checks": checks
+    }), 200 if ready else 503
+
+@main.route('/metrics')
+@limiter.exempt
+def metrics_endpoint():
+    return current_app.response_class(metrics.expose(), mimetype='text/plain; version=0.0.4')
 
 @main.errorhandler(404)
 def not_found_error(error):
-    return render_template('404.html', data=RESUME_DATA), 404
+    return view_models.render('404.html'), 404
 
 @main.errorhandler(500)
 def internal_error(error):
-    return render_template('500.html', data=RESUME_DATA), 500
+    return view_models.render('500.html'), 500
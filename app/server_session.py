@@ -0,0 +1,470 @@
+"""
+Server-side sessions
+The cookie carries only an opaque session ID; session data lives in a backend
+chosen by SESSION_BACKEND (sqlite:///path, the default; redis://host:port/db;
+cookie to keep Flask's signed-cookie sessions; or memory:// for tests and a
+single worker). Sessions load on first access and are written back only when
+modified, so requests that never touch the session do no session I/O at all.
+Non-permanent sessions expire from the backend after SESSION_NON_PERMANENT_TTL
+"""
+
+from flask.sessions import SessionInterface, SessionMixin, session_json_serializer
+from app.ttl_cache import TTLCache
+import os
+import queue
+import re
+import secrets
+import socket
+import socketserver
+import sqlite3
+import sys
+import threading
+import time
+import urllib.parse
+
+import click
+
+DEFAULT_SQLITE_PATH = '/tmp/reborncloud-sessions.db'
+SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{43}$')
+NAMESPACE_PATTERN = re.compile(r'^[a-z][a-z0-9_]*$')
+
+
+class MemorySessionBackend:
+    """Process-local LRU (unbounded when max_entries is None); only suitable for a single worker"""
+
+    def __init__(self, max_entries=10000):
+        self._entries = TTLCache(max_entries=max_entries)
+
+    def get(self, sid):
+        return self._entries.get(sid)
+
+    def set(self, sid, data, ttl):
+        self._entries.set(sid, data, ttl=ttl)
+
+    def add(self, sid, data, ttl):
+        return self._entries.add(sid, data, ttl=ttl)
+
+    def delete(self, sid):
+        self._entries.pop(sid)
+
+
+class SQLiteSessionBackend:
+    """Sessions in a WAL-mode SQLite file shared by every worker on a host"""
+
+    CLEANUP_EVERY = 1024
+
+    def __init__(self, path=DEFAULT_SQLITE_PATH, timeout=1.0, table='sessions'):
+        if not NAMESPACE_PATTERN.match(table):
+            raise ValueError(f"Invalid session table name {table!r}")
+        self.path = path
+        self.timeout = timeout
+        self.table = table
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connection(self):
+        # Per thread and per process, as for the rate limit storage
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.table} '
+                '(sid TEXT PRIMARY KEY, data BLOB NOT NULL, expires REAL NOT NULL)'
+            )
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, sid):
+        row = self._connection().execute(
+            f'SELECT data FROM {self.table} WHERE sid = ? AND expires > ?', (sid, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, sid, data, ttl):
+        now = time.time()
+        self._connection().execute(
+            f'INSERT OR REPLACE INTO {self.table} (sid, data, expires) VALUES (?, ?, ?)', (sid, data, now + ttl)
+        )
+        self._cleanup(now)
+
+    def add(self, sid, data, ttl):
+        """Insert unless an unexpired row exists; return whether it was inserted"""
+        now = time.time()
+        cursor = self._connection().execute(
+            f'INSERT INTO {self.table} (sid, data, expires) VALUES (?, ?, ?) '
+            'ON CONFLICT(sid) DO UPDATE SET data = excluded.data, expires = excluded.expires '
+            f'WHERE {self.table}.expires <= ?', (sid, data, now + ttl, now)
+        )
+        self._cleanup(now)
+        return cursor.rowcount == 1
+
+    def _cleanup(self, now):
+        self._writes += 1
+        if self._writes % self.CLEANUP_EVERY == 0:
+            self._connection().execute(f'DELETE FROM {self.table} WHERE expires <= ?', (now,))
+
+    def delete(self, sid):
+        self._connection().execute(f'DELETE FROM {self.table} WHERE sid = ?', (sid,))
+
+
+class RedisSessionBackend:
+    """Minimal pooled Redis client speaking just GET, SET EX [NX] and DEL over RESP"""
+
+    def __init__(self, host='127.0.0.1', port=6379, db=0, password=None, pool_size=8, timeout=1.0, prefix='session'):
+        self.address = (host, port)
+        self.prefix = prefix
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self._pid = os.getpid()
+
+    def _connect(self):
+        sock = socket.create_connection(self.address, timeout=self.timeout)
+        connection = (sock, sock.makefile('rb'))
+        if self.password:
+            self._call(connection, 'AUTH', self.password)
+        if self.db:
+            self._call(connection, 'SELECT', self.db)
+        return connection
+
+    def _execute(self, *args):
+        # Pooled sockets opened before a fork must not be shared with children
+        if self._pid != os.getpid():
+            self._pool = queue.LifoQueue(maxsize=self._pool.maxsize)
+            self._pid = os.getpid()
+        try:
+            connection, pooled = self._pool.get_nowait(), True
+        except queue.Empty:
+            connection, pooled = self._connect(), False
+        try:
+            reply = self._call(connection, *args)
+        except (OSError, ConnectionError):
+            connection[0].close()
+            if not pooled:
+                raise
+            # An idle pooled connection may have been dropped by the server
+            connection = self._connect()
+            reply = self._call(connection, *args)
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection[0].close()
+        return reply
+
+    def _call(self, connection, *args):
+        sock, reader = connection
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            value = arg if isinstance(arg, bytes) else str(arg).encode('utf-8')
+            parts.append(b'$%d\r\n%s\r\n' % (len(value), value))
+        sock.sendall(b''.join(parts))
+        return _read_reply(reader)
+
+    def get(self, sid):
+        return self._execute('GET', f"{self.prefix}:{sid}")
+
+    def set(self, sid, data, ttl):
+        self._execute('SET', f"{self.prefix}:{sid}", data, 'EX', max(int(ttl), 1))
+
+    def add(self, sid, data, ttl):
+        return self._execute('SET', f"{self.prefix}:{sid}", data, 'EX', max(int(ttl), 1), 'NX') == 'OK'
+
+    def delete(self, sid):
+        self._execute('DEL', f"{self.prefix}:{sid}")
+
+
+def _read_reply(reader):
+    line = reader.readline()
+    if not line:
+        raise ConnectionError("connection closed by server")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b'+':
+        return payload.decode('utf-8')
+    if kind == b'-':
+        raise ConnectionError(payload.decode('utf-8'))
+    if kind == b':':
+        return int(payload)
+    if kind == b'$':
+        length = int(payload)
+        if length < 0:
+            return None
+        return reader.read(length + 2)[:-2]
+    raise ConnectionError(f"unexpected reply {line!r}")
+
+
+class LocalRedisStandIn(socketserver.ThreadingTCPServer):
+    """In-process server answering the commands RedisSessionBackend sends, for tests and development"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.data = {}
+        self.lock = threading.Lock()
+        self.commands = 0
+        super().__init__((host, port), _StandInHandler)
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"redis://{host}:{port}/0"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, name='redis-stand-in', daemon=True).start()
+        return self
+
+
+class _StandInHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            try:
+                args = self._read_command()
+            except ConnectionError:
+                return
+            if args is None:
+                return
+            self.wfile.write(self._dispatch(args))
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b'*'):
+            raise ConnectionError("inline commands are not supported")
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _dispatch(self, args):
+        server = self.server
+        command = args[0].upper()
+        now = time.monotonic()
+        with server.lock:
+            server.commands += 1
+            if command == b'PING':
+                return b'+PONG\r\n'
+            if command in (b'SELECT', b'AUTH'):
+                return b'+OK\r\n'
+            if command == b'GET':
+                entry = server.data.get(args[1])
+                if entry is None or (entry[1] is not None and entry[1] <= now):
+                    server.data.pop(args[1], None)
+                    return b'$-1\r\n'
+                return b'$%d\r\n%s\r\n' % (len(entry[0]), entry[0])
+            if command == b'SET':
+                options = [arg.upper() for arg in args[3:]]
+                expires = None
+                if b'EX' in options:
+                    expires = now + int(args[3 + options.index(b'EX') + 1])
+                existing = server.data.get(args[1])
+                if b'NX' in options and existing is not None and (existing[1] is None or existing[1] > now):
+                    return b'$-1\r\n'
+                server.data[args[1]] = (args[2], expires)
+                return b'+OK\r\n'
+            if command == b'DEL':
+                removed = sum(server.data.pop(key, None) is not None for key in args[1:])
+                return b':%d\r\n' % removed
+        return b'-ERR unknown command\r\n'
+
+
+def backend_from_url(url, max_entries=10000, namespace=None):
+    """Build a backend from a URL; ``max_entries`` bounds the memory backend (None for unbounded)
+
+    ``namespace`` keeps other records (e.g. download token nonces) apart from
+    sessions: it names the SQLite table or the Redis key prefix
+    """
+    parsed = urllib.parse.urlparse(url)
+    if parsed.scheme == 'memory':
+        return MemorySessionBackend(max_entries=max_entries)
+    if parsed.scheme == 'sqlite':
+        return SQLiteSessionBackend(parsed.path or DEFAULT_SQLITE_PATH, table=namespace or 'sessions')
+    if parsed.scheme == 'redis':
+        return RedisSessionBackend(
+            host=parsed.hostname or '127.0.0.1',
+            port=parsed.port or 6379,
+            db=int(parsed.path.lstrip('/') or 0),
+            password=parsed.password,
+            prefix=namespace or 'session'
+        )
+    raise ValueError(f"Unsupported SESSION_BACKEND {url!r}")
+
+
+class ServerSideSession(SessionMixin):
+    """Session dict that fetches its data from the backend on first access"""
+
+    def __init__(self, interface, sid=None):
+        self.sid = sid
+        self.new = sid is None
+        self.modified = False
+        self.accessed = False
+        self._interface = interface
+        self._data = None
+
+    @property
+    def loaded(self):
+        return self._data is not None
+
+    def _load(self):
+        if self._data is None:
+            self.accessed = True
+            data = self._interface.load(self.sid) if self.sid else None
+            if data is None:
+                # Never adopt an ID the backend does not know: a client-chosen
+                # ID would otherwise become a valid session (session fixation)
+                self.sid = None
+                self.new = True
+                data = {}
+            self._data = data
+        return self._data
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __setitem__(self, key, value):
+        self._load()[key] = value
+        self.modified = True
+
+    def __delitem__(self, key):
+        del self._load()[key]
+        self.modified = True
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __repr__(self):
+        state = repr(self._data) if self.loaded else 'not loaded'
+        return f"<{type(self).__name__} {state}>"
+
+
+class ServerSessionInterface(SessionInterface):
+    """Stores sessions in a backend, keyed by a random ID held in the cookie"""
+
+    serializer = session_json_serializer
+
+    def __init__(self, backend, logger=None):
+        self.backend = backend
+        self.logger = logger
+        self.loads = 0
+        self.writes = 0
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid is not None and not SESSION_ID_PATTERN.match(sid):
+            sid = None
+        return ServerSideSession(self, sid)
+
+    def load(self, sid):
+        """Return the stored session data, or None if ``sid`` is unknown or unreadable"""
+        self.loads += 1
+        try:
+            data = self.backend.get(sid)
+            if data is None:
+                return None
+            return self.serializer.loads(data.decode('utf-8') if isinstance(data, bytes) else data)
+        except Exception as e:
+            if self.logger is not None:
+                self.logger.error(f"Session load failed: {str(e)}")
+            return None
+
+    def save_session(self, app, session, response):
+        if not session.loaded:
+            return
+        response.vary.add('Cookie')
+        if not session.modified:
+            return
+
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        if not session:
+            if session.sid:
+                try:
+                    self.backend.delete(session.sid)
+                except Exception as e:
+                    if self.logger is not None:
+                        self.logger.error(f"Session delete failed: {str(e)}")
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        if session.sid is None:
+            session.sid = secrets.token_urlsafe(32)
+        if session.permanent:
+            ttl = app.permanent_session_lifetime.total_seconds()
+        else:
+            # The cookie ends with the browser session, which the server never sees
+            ttl = app.config['SESSION_NON_PERMANENT_TTL']
+        try:
+            self.backend.set(session.sid, self.serializer.dumps(dict(session)).encode('utf-8'), ttl)
+        except Exception as e:
+            if self.logger is not None:
+                self.logger.error(f"Session save failed: {str(e)}")
+            return
+        self.writes += 1
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
+
+
+def server_workers():
+    """Worker processes the app is served by: gunicorn's -w/--workers when running under it, else WEB_CONCURRENCY"""
+    workers = None
+    if 'gunicorn.arbiter' in sys.modules:
+        # The arbiter's config object is not reachable from the app, so parse
+        # the same command line and GUNICORN_CMD_ARGS it was built from
+        from gunicorn.config import Config
+        config = Config()
+        parser = config.parser()
+        for args in (config.get_cmd_args_from_env(), sys.argv[1:]):
+            parsed = parser.parse_known_args(args)[0]
+            workers = parsed.workers or workers
+    return int(workers or os.environ.get('WEB_CONCURRENCY', 1))
+
+
+class ServerSessions:
+    """Installs the server-side session interface selected by SESSION_BACKEND"""
+
+    def __init__(self, app=None):
+        self.interface = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('SESSION_BACKEND', f"sqlite://{DEFAULT_SQLITE_PATH}")
+        app.config.setdefault('SESSION_NON_PERMANENT_TTL', 1800)
+
+        @app.cli.command('session-stand-in')
+        @click.option('--host', default='127.0.0.1', show_default=True)
+        @click.option('--port', default=6380, show_default=True)
+        def session_stand_in_command(host, port):
+            """Run a local Redis stand-in for the redis:// session backend."""
+            server = LocalRedisStandIn(host, port)
+            print(f"Serving SESSION_BACKEND={server.url}")
+            server.serve_forever()
+
+        app.extensions['server_sessions'] = self
+        if app.config['SESSION_BACKEND'] == 'cookie':
+            return
+        if app.config['SESSION_BACKEND'].startswith('memory:') and not app.testing and server_workers() > 1:
+            # Each worker would hold its own sessions and drop them on every other request
+            raise ValueError("SESSION_BACKEND memory:// is only for tests or a single worker")
+        self.interface = ServerSessionInterface(backend_from_url(app.config['SESSION_BACKEND']), app.logger)
+        app.session_interface = self.interface
+
+
+server_sessions = ServerSessions()
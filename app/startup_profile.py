@@ -0,0 +1,103 @@
+"""
+Startup import profiling
+Boots the app in a fresh interpreter under ``python -X importtime`` and reports
+where cold-start time goes, optionally failing when it exceeds a budget
+"""
+
+import os
+import subprocess
+import sys
+
+import click
+
+STARTUP_TARGET = 'from app import create_app; create_app()'
+
+
+class ImportRecord:
+    __slots__ = ('name', 'self_us', 'cumulative_us', 'depth')
+
+    def __init__(self, name, self_us, cumulative_us, depth):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+
+
+def parse_importtime(output):
+    """Parse ``-X importtime`` stderr into ImportRecord objects"""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        # One leading space at top level, two more per nesting level
+        depth = (len(name) - len(stripped) - 1) // 2
+        records.append(ImportRecord(stripped, int(parts[0]), int(parts[1]), depth))
+    return records
+
+
+def profile_startup(target=STARTUP_TARGET, cwd=None):
+    """Run ``target`` in a new interpreter and return its import records"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', target],
+        cwd=cwd, capture_output=True, text=True,
+        env=dict(os.environ, PAGE_CACHE_PRELOAD='false', TEMPLATE_PRECOMPILE='false')
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else 'startup failed')
+    return parse_importtime(result.stderr)
+
+
+def total_import_ms(records):
+    return sum(record.cumulative_us for record in records if record.depth == 0) / 1000
+
+
+class StartupProfile:
+    """Registers the ``flask startup-report`` command"""
+
+    def __init__(self, app=None):
+        self.budget_ms = 300
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('STARTUP_IMPORT_BUDGET_MS', 300)
+        self.budget_ms = float(app.config['STARTUP_IMPORT_BUDGET_MS'])
+        root = os.path.dirname(app.root_path)
+
+        @app.cli.command('startup-report')
+        @click.option('--top', default=20, show_default=True, help='Number of modules to list.')
+        @click.option('--runs', default=3, show_default=True, help='Cold starts to measure; the fastest is reported.')
+        @click.option('--check', is_flag=True, help='Exit non-zero if the import time exceeds the budget.')
+        @click.option('--budget-ms', type=float, default=None, help='Override STARTUP_IMPORT_BUDGET_MS.')
+        def startup_report_command(top, runs, check, budget_ms):
+            """Show which imports dominate a cold create_app()."""
+            budget = self.budget_ms if budget_ms is None else budget_ms
+            try:
+                profiles = [profile_startup(cwd=root) for _ in range(max(runs, 1))]
+            except RuntimeError as e:
+                raise click.ClickException(f"App failed to start: {str(e)}")
+            records = min(profiles, key=total_import_ms)
+            total = total_import_ms(records)
+
+            click.echo(f"{'cumulative':>12}{'self':>10}  module")
+            for record in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]:
+                indent = '  ' * record.depth
+                click.echo(f"{record.cumulative_us / 1000:>10.1f}ms{record.self_us / 1000:>8.1f}ms  {indent}{record.name}")
+
+            app_records = [r for r in records if r.name == 'app' or r.name.startswith('app.')]
+            app_self = sum(r.self_us for r in app_records) / 1000
+            click.echo(f"\nTotal import time: {total:.1f}ms (best of {len(profiles)}), "
+                       f"of which app modules themselves: {app_self:.1f}ms; budget {budget:.0f}ms")
+
+            if check and total > budget:
+                raise click.ClickException(f"Cold import time {total:.1f}ms exceeds budget of {budget:.0f}ms")
+
+        app.extensions['startup_profile'] = self
+
+
+startup_profile = StartupProfile()
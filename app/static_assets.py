@@ -0,0 +1,188 @@
+"""
+Fingerprinted, precompressed static assets
+A build step copies every static file to a content-hashed name with .gz/.br
+siblings and records them in a manifest; url_for('static', ...) then emits the
+hashed name, which is served as immutable in the best encoding the client accepts
+"""
+
+from flask import current_app, request, send_from_directory
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+HASH_LENGTH = 12
+MIN_COMPRESS_SIZE = 256
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+# The resume PDF is a protected download and must never get a public static URL
+EXCLUDED_PREFIXES = ('documents/',)
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+IMMUTABLE_MAX_AGE = 31536000
+
+
+def compress(encoding, body):
+    """Compress ``body`` at the highest level for ``encoding``; None if it is unavailable"""
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=9, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(body, quality=11)
+    return None
+
+
+class StaticAssets:
+    """Manifest-driven static URLs and precompressed static file serving"""
+
+    def __init__(self, app=None):
+        self.source_dir = None
+        self.build_dir = None
+        self.assets = {}
+        self.hashed = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('STATIC_FINGERPRINT', True)
+        app.config.setdefault('STATIC_BUILD_DIR', '')
+
+        self.source_dir = app.static_folder
+        self.build_dir = app.config['STATIC_BUILD_DIR'] or os.path.join(app.root_path, 'static-dist')
+
+        @app.cli.command('build-static')
+        def build_static_command():
+            """Fingerprint and precompress static assets."""
+            self.build()
+            print(f"Built {len(self.assets)} static assets into {self.build_dir}")
+
+        app.extensions['static_assets'] = self
+        if not app.config['STATIC_FINGERPRINT'] or not app.has_static_folder:
+            return
+
+        try:
+            if not self.load():
+                self.build()
+        except OSError as e:
+            app.logger.warning(f"Static asset fingerprinting disabled: {str(e)}")
+            self.assets = {}
+            self.hashed = {}
+            return
+
+        app.url_defaults(self._hashed_url_defaults)
+        app.view_functions['static'] = self.send_static
+
+    def _sources(self):
+        for root, _, files in os.walk(self.source_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                filename = os.path.relpath(path, self.source_dir).replace(os.sep, '/')
+                if not filename.startswith(EXCLUDED_PREFIXES):
+                    yield filename, path
+
+    def load(self):
+        """Load the manifest if it exists and still matches the sources on disk"""
+        try:
+            with open(os.path.join(self.build_dir, MANIFEST_NAME), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if manifest.get('version') != MANIFEST_VERSION:
+            return False
+
+        assets = manifest.get('assets', {})
+        sources = dict(self._sources())
+        if set(assets) != set(sources):
+            return False
+        for filename, path in sources.items():
+            stat = os.stat(path)
+            if [stat.st_size, stat.st_mtime_ns] != assets[filename]['source']:
+                return False
+        self._index(assets)
+        return True
+
+    def build(self):
+        """Write hashed copies plus compressed siblings and a fresh manifest"""
+        os.makedirs(self.build_dir, exist_ok=True)
+        assets = {}
+        for filename, path in self._sources():
+            with open(path, 'rb') as f:
+                body = f.read()
+            stat = os.stat(path)
+            digest = hashlib.sha256(body).hexdigest()[:HASH_LENGTH]
+            stem, ext = os.path.splitext(filename)
+            hashed = f"{stem}.{digest}{ext}"
+            target = os.path.join(self.build_dir, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if not os.path.exists(target):
+                shutil.copyfile(path, target)
+
+            encodings = []
+            mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            if len(body) >= MIN_COMPRESS_SIZE and mimetype.startswith(COMPRESSIBLE_TYPES):
+                for encoding, suffix in ENCODINGS:
+                    compressed = compress(encoding, body)
+                    if compressed is not None and len(compressed) < len(body):
+                        self._write(target + suffix, compressed)
+                        encodings.append(encoding)
+
+            assets[filename] = {
+                'path': hashed,
+                'encodings': encodings,
+                'source': [stat.st_size, stat.st_mtime_ns]
+            }
+
+        self._write(
+            os.path.join(self.build_dir, MANIFEST_NAME),
+            json.dumps({'version': MANIFEST_VERSION, 'assets': assets}, indent=2, sort_keys=True).encode('utf-8')
+        )
+        self._index(assets)
+
+    def _write(self, path, data):
+        # Write then rename, so a concurrently starting worker never reads a partial file
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, 'wb') as f:
+            f.write(data)
+        os.replace(temp, path)
+
+    def _index(self, assets):
+        self.assets = assets
+        self.hashed = {entry['path']: entry for entry in assets.values()}
+
+    def _hashed_url_defaults(self, endpoint, values):
+        if endpoint == 'static':
+            entry = self.assets.get(values.get('filename'))
+            if entry is not None:
+                values['filename'] = entry['path']
+
+    def send_static(self, filename):
+        entry = self.hashed.get(filename)
+        if entry is None:
+            return current_app.send_static_file(filename)
+
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        served, content_encoding = filename, None
+        if entry['encodings']:
+            accepted = request.accept_encodings
+            for encoding, suffix in ENCODINGS:
+                if encoding in entry['encodings'] and accepted[encoding]:
+                    served, content_encoding = filename + suffix, encoding
+                    break
+
+        response = send_from_directory(self.build_dir, served, mimetype=mimetype, max_age=IMMUTABLE_MAX_AGE)
+        if content_encoding:
+            response.headers['Content-Encoding'] = content_encoding
+        if entry['encodings']:
+            response.vary.add('Accept-Encoding')
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+
+
+static_assets = StaticAssets()
@@ -0,0 +1,305 @@
+"""
+Static site export for CDN origin offload
+`flask export` renders every public GET route of the main blueprint through
+the real app into a directory of HTML/JSON files with .gz/.br siblings, copies
+the fingerprinted static assets and responsive images next to them, and writes
+a manifest mapping URL paths to files. Routes that need a live request (forms,
+downloads, flashed messages, probes) are listed in the manifest as live.
+Exports are incremental: a page is re-rendered only when the fingerprint of
+its inputs (content version, the templates it uses, asset manifests, view
+code and config) changed, and pages are rendered across a process pool
+"""
+
+from flask import template_rendered
+from jinja2 import TemplateNotFound
+from app.page_cache import template_dependencies
+from app.resume_content import get_resume
+from app.responsive_images import responsive_images
+from app.static_assets import ENCODINGS, MIN_COMPRESS_SIZE, compress, static_assets
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import click
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+EXPORT_BLUEPRINT = 'main'
+# GET routes of the main blueprint that stay on the origin
+LIVE_ENDPOINTS = frozenset({
+    'main.resume_access',  # shows flashed verification errors after a redirect
+    'main.download_resume',
+    'main.download_resume_legacy',
+    'main.health_check',
+    'main.readiness_check',
+    'main.metrics_endpoint',
+})
+# View code and config that change rendered output without touching content or templates
+CODE_INPUTS = ('routes.py', 'view_models.py', 'resume_api.py', 'responsive_images.py')
+CONFIG_INPUTS = ('TITLE', 'AUTHOR', 'DOMAIN')
+PAGE_CACHE_CONTROL = 'public, max-age=0, must-revalidate'
+STATIC_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+EXTENSIONS = {'text/html': '.html', 'application/json': '.json'}
+
+_worker_app = None
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, 'wb') as f:
+        f.write(data)
+    os.replace(temp, path)
+
+
+def _output_name(path, mimetype):
+    stem = path.strip('/') or 'index'
+    return stem + EXTENSIONS.get(mimetype, '')
+
+
+def _prepare(app):
+    """Render without the page cache, which would skip the template signals, or rate limits"""
+    from app import limiter
+    previous = (app.config['PAGE_CACHE_ENABLED'], limiter.enabled)
+    app.config['PAGE_CACHE_ENABLED'] = False
+    limiter.enabled = False
+    return previous
+
+
+def _init_worker():
+    global _worker_app
+    from app import create_app
+    _worker_app = create_app()
+    _prepare(_worker_app)
+
+
+def _render_page(path, output_dir):
+    """Render one route in a worker, write it with compressed siblings and return its manifest entry"""
+    app = _worker_app
+    rendered = []
+
+    def record(sender, template, context, **extra):
+        rendered.append(template.name)
+
+    with template_rendered.connected_to(record, app):
+        response = app.test_client().get(path)
+    if response.status_code != 200:
+        raise RuntimeError(f"{path} answered {response.status_code}")
+
+    body = response.get_data()
+    name = _output_name(path, response.mimetype)
+    target = os.path.join(output_dir, name)
+    _write(target, body)
+    encodings = []
+    if len(body) >= MIN_COMPRESS_SIZE:
+        for encoding, suffix in ENCODINGS:
+            compressed = compress(encoding, body)
+            if compressed is not None and len(compressed) < len(body):
+                _write(target + suffix, compressed)
+                encodings.append(encoding)
+
+    templates = sorted(template_dependencies(app.jinja_env, rendered)) if rendered else []
+    return {
+        'file': name,
+        'content_type': response.content_type,
+        'etag': _sha256(body),
+        'encodings': encodings,
+        'cache_control': PAGE_CACHE_CONTROL,
+        'templates': templates
+    }
+
+
+class StaticExport:
+    """Exports the public pages and their assets as a static site"""
+
+    def __init__(self, app=None):
+        self.app = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('STATIC_EXPORT_DIR', '')
+        self.app = app
+
+        @app.cli.command('export')
+        @click.option('--output', default=None, help='Export directory (default: STATIC_EXPORT_DIR or ./site-export).')
+        @click.option('--workers', default=os.cpu_count() or 1, show_default=True,
+                      help='Render processes; 0 renders in this process.')
+        @click.option('--force', is_flag=True, help='Re-render every page even if its inputs are unchanged.')
+        def export_command(output, workers, force):
+            """Export the public pages as a static site with a manifest."""
+            output = output or app.config['STATIC_EXPORT_DIR'] or os.path.join(os.getcwd(), 'site-export')
+            started = time.perf_counter()
+            stats = self.export(output, workers=workers, force=force)
+            print(
+                f"Exported {stats['pages']} pages ({stats['rendered']} rendered, {stats['reused']} unchanged) "
+                f"and {stats['static']} static files to {output} in {time.perf_counter() - started:.2f}s"
+            )
+            print(f"Live routes: {', '.join(stats['live'])}")
+
+        app.extensions['static_export'] = self
+
+    def routes(self):
+        """Split the app's GET routes into ``(exported paths, live rules)``"""
+        exported, live = [], []
+        for rule in self.app.url_map.iter_rules():
+            if rule.endpoint in ('static', 'responsive_image'):
+                continue
+            if (rule.endpoint.startswith(f"{EXPORT_BLUEPRINT}.") and 'GET' in rule.methods
+                    and not rule.arguments and rule.endpoint not in LIVE_ENDPOINTS):
+                exported.append(rule.rule)
+            else:
+                live.append(rule.rule)
+        return sorted(exported), sorted(set(live))
+
+    def export(self, output_dir, workers=1, force=False):
+        """Bring ``output_dir`` up to date and return export statistics"""
+        output_dir = os.path.abspath(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+        previous = self._load_manifest(output_dir)
+        exported, live = self.routes()
+
+        with self.app.app_context():
+            inputs = self._global_inputs()
+            pages, pending = {}, []
+            for path in exported:
+                entry = previous.get('pages', {}).get(path)
+                if not force and entry is not None and self._is_current(output_dir, entry, inputs):
+                    pages[path] = entry
+                else:
+                    pending.append(path)
+
+            for path, entry in zip(pending, self._render(pending, output_dir, workers)):
+                entry['inputs'] = self._page_inputs(inputs, entry['templates'])
+                pages[path] = entry
+
+        static = self._copy_static(output_dir)
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'content_version': get_resume().version,
+            'pages': pages,
+            'static': static,
+            'live': live
+        }
+        self._remove_stale(output_dir, previous, manifest)
+        _write(os.path.join(output_dir, MANIFEST_NAME),
+               json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+        return {
+            'pages': len(pages),
+            'rendered': len(pending),
+            'reused': len(pages) - len(pending),
+            'static': len(static),
+            'live': live
+        }
+
+    def _render(self, paths, output_dir, workers):
+        if not paths:
+            return []
+        if workers < 1:
+            global _worker_app
+            from app import limiter
+            _worker_app = self.app
+            page_cache_enabled, limiter_enabled = _prepare(self.app)
+            try:
+                return [_render_page(path, output_dir) for path in paths]
+            finally:
+                self.app.config['PAGE_CACHE_ENABLED'] = page_cache_enabled
+                limiter.enabled = limiter_enabled
+                _worker_app = None
+        # Deferred: pulls in multiprocessing, which the web workers never need
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths)), initializer=_init_worker) as pool:
+            return list(pool.map(_render_page, paths, [output_dir] * len(paths)))
+
+    def _load_manifest(self, output_dir):
+        try:
+            with open(os.path.join(output_dir, MANIFEST_NAME), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if manifest.get('version') == MANIFEST_VERSION else {}
+
+    def _global_inputs(self):
+        """Fingerprint of everything every page depends on besides its templates"""
+        digest = hashlib.sha256()
+        digest.update(get_resume().version.encode('utf-8'))
+        digest.update(json.dumps(static_assets.assets, sort_keys=True).encode('utf-8'))
+        digest.update(json.dumps(responsive_images.images, sort_keys=True).encode('utf-8'))
+        digest.update(json.dumps({key: self.app.config.get(key) for key in CONFIG_INPUTS}, sort_keys=True).encode('utf-8'))
+        for name in CODE_INPUTS:
+            with open(os.path.join(self.app.root_path, name), 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def _page_inputs(self, inputs, templates):
+        env = self.app.jinja_env
+        digest = hashlib.sha256(inputs.encode('utf-8'))
+        for name in templates:
+            source = env.loader.get_source(env, name)[0]
+            digest.update(f"{name}\0{_sha256(source.encode('utf-8'))}\0".encode('utf-8'))
+        return digest.hexdigest()
+
+    def _is_current(self, output_dir, entry, inputs):
+        try:
+            page_inputs = self._page_inputs(inputs, entry['templates'])
+        except TemplateNotFound:
+            return False
+        files = [entry['file']] + [entry['file'] + suffix for encoding, suffix in ENCODINGS if encoding in entry['encodings']]
+        return page_inputs == entry.get('inputs') and all(
+            os.path.exists(os.path.join(output_dir, name)) for name in files
+        )
+
+    def _copy_static(self, output_dir):
+        """Copy fingerprinted assets and image derivatives; their names are content hashes, so existing files are kept"""
+        static = {}
+        suffixes = dict(ENCODINGS)
+        for entry in static_assets.assets.values():
+            name = f"static/{entry['path']}"
+            source = os.path.join(static_assets.build_dir, entry['path'])
+            self._copy(source, os.path.join(output_dir, name))
+            for encoding in entry['encodings']:
+                suffix = suffixes[encoding]
+                self._copy(source + suffix, os.path.join(output_dir, name + suffix))
+            static[f"/{name}"] = {
+                'file': name,
+                'encodings': entry['encodings'],
+                'cache_control': STATIC_CACHE_CONTROL
+            }
+        for image in responsive_images.images.values():
+            for variants in image['variants'].values():
+                for _, filename in variants:
+                    name = f"static/responsive/{filename}"
+                    self._copy(os.path.join(responsive_images.output_dir, filename), os.path.join(output_dir, name))
+                    static[f"/{name}"] = {'file': name, 'encodings': [], 'cache_control': STATIC_CACHE_CONTROL}
+        return static
+
+    def _copy(self, source, target):
+        if os.path.exists(target) and os.path.getsize(target) == os.path.getsize(source):
+            return
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(source, target)
+
+    def _remove_stale(self, output_dir, previous, manifest):
+        """Delete files the previous export wrote that the new one no longer references"""
+        def files(manifest):
+            names = set()
+            for section in ('pages', 'static'):
+                for entry in manifest.get(section, {}).values():
+                    names.add(entry['file'])
+                    names.update(entry['file'] + suffix for encoding, suffix in ENCODINGS if encoding in entry['encodings'])
+            return names
+
+        for name in files(previous) - files(manifest):
+            try:
+                os.remove(os.path.join(output_dir, name))
+            except OSError:
+                pass
+
+
+static_export = StaticExport()
@@ -0,0 +1,73 @@
+"""
+Template precompilation and persistent Jinja bytecode cache
+Every template is compiled once in create_app, so gunicorn workers forked
+after --preload (including ones recycled by --max-requests) inherit compiled
+templates; the bytecode cache directory lets the master itself skip
+compilation when it was filled ahead of time, e.g. while building the image
+"""
+
+from jinja2 import FileSystemBytecodeCache
+import os
+import time
+
+
+class TolerantBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache that keeps serving from a directory it cannot write to"""
+
+    def dump_bytecode(self, bucket):
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+class TemplateCache:
+    """Configures the bytecode cache and compiles templates ahead of requests"""
+
+    def __init__(self, app=None):
+        self.directory = None
+        self.compiled = 0
+        self.compile_time = 0.0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('TEMPLATE_PRECOMPILE', True)
+        app.config.setdefault('TEMPLATE_BYTECODE_CACHE_DIR', '')
+
+        self.directory = app.config['TEMPLATE_BYTECODE_CACHE_DIR'] or None
+        if self.directory:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+            except OSError as e:
+                app.logger.warning(f"Template bytecode cache directory unavailable: {str(e)}")
+            # Must be in place before the first template is loaded
+            app.jinja_env.bytecode_cache = TolerantBytecodeCache(self.directory)
+
+        @app.cli.command('compile-templates')
+        def compile_templates_command():
+            """Compile every template, filling the bytecode cache directory."""
+            app.jinja_env.cache.clear()
+            count = self.precompile(app)
+            target = self.directory or 'memory only; set TEMPLATE_BYTECODE_CACHE_DIR to persist'
+            print(f"Compiled {count} templates in {self.compile_time * 1000:.1f} ms ({target})")
+
+        app.extensions['template_cache'] = self
+
+    def precompile(self, app):
+        """Load every HTML template into the environment's cache; return how many"""
+        env = app.jinja_env
+        started = time.perf_counter()
+        count = 0
+        for name in env.list_templates(filter_func=lambda name: name.endswith('.html')):
+            try:
+                env.get_template(name)
+                count += 1
+            except Exception as e:
+                app.logger.error(f"Template precompilation failed for {name}: {str(e)}")
+        self.compiled = count
+        self.compile_time = time.perf_counter() - started
+        return count
+
+
+template_cache = TemplateCache()
@@ -1,118 +0,0 @@
-"""
-Flask Routes for RebornCloud Portfolio with full resume data
-"""
-
-from flask import Blueprint, render_template, jsonify, send_file, current_app
-from datetime import datetime
-import os
-
-main = Blueprint('main', __name__)
-
-RESUME_DATA = {
-    "personal_info": {
-        "name": "Elson Pulickeel Ealias",
-        "title": "Cloud Engineer | DevOps Engineer | SRE",
-        "email": "elsonpulikkan@gmail.com",
-        "phone": "+91 9562385469",
-        "location": "Kochi, Kerala, India",
-        "website": "https://reborncloud.online",
-        "github": "https://github.com/elsonpulikkan96",
-        "linkedin": "https://linkedin.com/in/elsondevops",
-        "medium": "https://medium.com/@elsonpulikkan"
-    },
-    "bio": "CloudOps and DevOps Engineer with 5+ years of experience managing high-availability cloud infrastructure on AWS, Kubernetes and Linux + Cloud-Native systems. Delivering Scalable and Reliable solutions through CI/CD Automation, Robust Monitoring and Adherence to SLI/SLO/SLA targets. Certified in CKA and AWS SAA with a proven track record of 24/7*365 Production Support and Enterprise-grade service delivery.",
-    "experience": [
-        {
-            "title": "Cloud Operation Engineer - 2",
-            "company": "EPI-USE India Pvt Ltd",
-            "duration": "October 2024 – Present",
-            "location": "Kochi, India",
-            "description": "Managing high-availability SAP S/4 HANA infrastructure on AWS for enterprise clients.",
-            "responsibilities": [
-                "Managed Uptime, High Availability of SAP S/4 HANA infrastructure on AWS for large-scale enterprise clients",
-                "Automated recurring cloud operations using AWS Lambda, Ansible and GitHub workflows",
-                "Provide end-to-end Incident management and RCA for SAP environments on AWS",
-                "Created AWS cost optimization reports using SMC Pricing Calculator",
-                "Collaborated with SAP Basis and AWS Billing teams to streamline deployment pipelines"
-            ],
-            "projects": [
-                "City of Palo Alto (COPA): Migrated SAP S/4HANA workloads from on-premise to AWS",
-                "Automated monthly patching tasks across Dev, QA and prod environments",
-                "Prepared cost optimization and estimation reports using AWS Pricing Calculator"
-            ],
-            "technologies": ["AWS", "SAP S/4 HANA", "Lambda", "Ansible", "GitHub Actions", "SMC"]
-        },
-        # Remaining experience entries omitted here for brevity, include all from previous full code 
-    ],
-    "skills": {
-        # Full skill categories and skills as in previous full code
-    },
-    "education": [
-        # Full education entries as in previous full code
-    ],
-    "certifications": [
-        # Full certification entries as in previous full code
-    ],
-    "stats": {
-        "years_experience": "5+",
-        "certifications": 4,
-        "uptime_achieved": "99.9%",
-        "support_hours": "24/7*365"
-    },
-    "languages": ["English", "Malayalam"],
-    "interests": ["Reading Fiction Novels", "Traveling", "Badminton", "EDM Music"]
-}
-
-@main.route('/')
-@main.route('/bio')
-def bio():
-    return render_template('bio.html', data=RESUME_DATA, current_page='bio')
-
-@main.route('/experience')
-def experience():
-    return render_template('experience.html', data=RESUME_DATA, current_page='experience')
-
-@main.route('/skills')
-def skills():
-    return render_template('skills.html', data=RESUME_DATA, current_page='skills')
-
-@main.route('/education')
-def education():
-    return render_template('education.html', data=RESUME_DATA, current_page='education')
-
-@main.route('/contact')
-def contact():
-    return render_template('contact.html', data=RESUME_DATA, current_page='contact')
-
-@main.route('/api/resume')
-def api_resume():
-    return jsonify(RESUME_DATA)
-
-@main.route('/download-resume')
-def download_resume():
-    try:
-        pdf_path = os.path.join(current_app.static_folder, 'documents', 'Elson-Ealias-Resume-2025.pdf')
-        if os.path.exists(pdf_path):
-            return send_file(pdf_path, as_attachment=True, download_name='Elson-Ealias-Resume-2025.pdf', mimetype='application/pdf')
-        else:
-            return jsonify({"error": "Resume file not found"}), 404
-    except Exception as e:
-        return jsonify({"error": f"Download failed: {str(e)}"}), 500
-
-@main.route('/health')
-def health_check():
-    return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "1.0.0",
-        "domain": "reborncloud.online",
-        "author": "Elson Pulickeel Ealias"
-    })
-
-@main.errorhandler(404)
-def not_found_error(error):
-    return render_template('404.html', data=RESUME_DATA), 404
-
-@main.errorhandler(500)
-def internal_error(error):
-    return render_template('500.html', data=RESUME_DATA), 500
@@ -0,0 +1,79 @@
+"""
+Thread-safe TTL cache with least-recently-used eviction; with max_entries=None
+it is unbounded and entries leave only when they expire
+"""
+
+from collections import OrderedDict
+import threading
+import time
+
+PURGE_EVERY = 1024
+
+
+class TTLCache:
+    """Maps keys to values that expire ``ttl`` seconds after they are stored"""
+
+    def __init__(self, ttl=300.0, max_entries=1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._inserts = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value, ttl=None):
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def add(self, key, value, ttl=None):
+        """Store ``value`` only if ``key`` is absent or expired; return whether it was stored"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                return False
+            self._entries[key] = (value, now + (self.ttl if ttl is None else ttl))
+            self._entries.move_to_end(key)
+            self._evict()
+            return True
+
+    def _evict(self):
+        # Called with the lock held
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return
+        self._inserts += 1
+        if self._inserts % PURGE_EVERY == 0:
+            now = time.monotonic()
+            for key in [key for key, (_, expires) in self._entries.items() if expires <= now]:
+                del self._entries[key]
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
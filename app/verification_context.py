@@ -0,0 +1,39 @@
+"""
+Compact professional verification state
+The session keeps only a small versioned binary record of a verification:
+when it happened, the risk level and the score, the fields later requests
+need. The rest of the analysed context is not kept anywhere
+"""
+
+import struct
+import time
+
+RECORD_VERSION = 2
+RISK_LEVELS = ('low', 'medium', 'high')
+# version, verified-at (epoch seconds), risk level code, total score
+_RECORD = struct.Struct('>BIBH')
+
+
+def encode_verification(context, verified_at=None):
+    """Pack the fields later requests need into a fixed-size record"""
+    return _RECORD.pack(
+        RECORD_VERSION,
+        int(time.time() if verified_at is None else verified_at),
+        RISK_LEVELS.index(context['risk_level']),
+        min(max(int(context['total_score']), 0), 0xFFFF)
+    )
+
+
+def decode_verification(record):
+    """Unpack a record from the session; None for anything malformed or outdated"""
+    if not isinstance(record, bytes) or len(record) != _RECORD.size:
+        return None
+    version, verified_at, risk, score = _RECORD.unpack(record)
+    if version != RECORD_VERSION or risk >= len(RISK_LEVELS):
+        return None
+    return {
+        'verified': True,
+        'timestamp': verified_at,
+        'risk_level': RISK_LEVELS[risk],
+        'total_score': score
+    }
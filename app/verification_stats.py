@@ -0,0 +1,101 @@
+"""
+Aggregated professional verification statistics
+Fixed-size counters and an exact-bucket context score histogram live in an
+anonymous shared memory mapping created at import time, so every gunicorn
+worker forked after --preload updates the same numbers and a read costs the
+same regardless of how much traffic has been recorded
+"""
+
+import mmap
+import multiprocessing
+
+RISK_LEVELS = ('low', 'medium', 'high')
+DOMAIN_TYPES = ('corporate', 'business', 'personal', 'unknown')
+FAILURE_REASONS = ('missing_information', 'challenge_failed', 'recaptcha_failed', 'error')
+COUNTERS = (
+    ('verifications', 'success', 'failure', 'challenges_attempted', 'challenges_passed', 'score_sum')
+    + tuple(f"risk:{level}" for level in RISK_LEVELS)
+    + tuple(f"domain:{kind}" for kind in DOMAIN_TYPES)
+    + tuple(f"failure:{reason}" for reason in FAILURE_REASONS)
+)
+# Context scores are small integers, so one bucket per value gives exact
+# percentiles; anything above the top bucket is clamped into it
+SCORE_BUCKETS = 256
+PERCENTILES = (50, 90, 99)
+
+
+class VerificationStats:
+    """Counters and a score histogram shared by every process forked from the creator"""
+
+    def __init__(self):
+        self._index = {name: i for i, name in enumerate(COUNTERS)}
+        slots = len(COUNTERS) + SCORE_BUCKETS
+        self._memory = mmap.mmap(-1, slots * 8)
+        self._values = memoryview(self._memory).cast('q')
+        self._lock = multiprocessing.Lock()
+
+    def record_success(self, risk_level, domain_type, context_score, challenge_passed=None):
+        bucket = len(COUNTERS) + min(max(int(context_score), 0), SCORE_BUCKETS - 1)
+        with self._lock:
+            self._incr('verifications')
+            self._incr('success')
+            self._incr(f"risk:{risk_level}")
+            self._incr(f"domain:{domain_type}")
+            self._values[self._index['score_sum']] += int(context_score)
+            self._values[bucket] += 1
+            if challenge_passed is not None:
+                self._incr('challenges_attempted')
+                if challenge_passed:
+                    self._incr('challenges_passed')
+
+    def record_failure(self, reason):
+        with self._lock:
+            self._incr('verifications')
+            self._incr('failure')
+            self._incr(f"failure:{reason}")
+            if reason == 'challenge_failed':
+                self._incr('challenges_attempted')
+
+    def _incr(self, name):
+        index = self._index.get(name)
+        if index is not None:
+            self._values[index] += 1
+
+    def snapshot(self):
+        with self._lock:
+            values = self._values.tolist()
+        counters = dict(zip(COUNTERS, values))
+        histogram = values[len(COUNTERS):]
+        scored = counters['success']
+
+        percentiles = {}
+        targets = [(p, p / 100 * scored) for p in PERCENTILES]
+        seen = 0
+        for score, count in enumerate(histogram):
+            seen += count
+            while targets and count and seen >= targets[0][1]:
+                percentiles[f"p{targets.pop(0)[0]}"] = score
+        for p, _ in targets:
+            percentiles[f"p{p}"] = 0
+
+        attempted = counters['challenges_attempted']
+        return {
+            'total_verifications': counters['verifications'],
+            'successful_verifications': scored,
+            'failed_verifications': counters['failure'],
+            'corporate_access': counters['domain:corporate'],
+            'challenge_success_rate': round(counters['challenges_passed'] / attempted, 4) if attempted else 0,
+            'average_context_score': round(counters['score_sum'] / scored, 2) if scored else 0,
+            'context_score_percentiles': percentiles,
+            'risk_levels': {level: counters[f"risk:{level}"] for level in RISK_LEVELS},
+            'domain_types': {kind: counters[f"domain:{kind}"] for kind in DOMAIN_TYPES},
+            'failures': {reason: counters[f"failure:{reason}"] for reason in FAILURE_REASONS}
+        }
+
+    def reset(self):
+        with self._lock:
+            for i in range(len(self._values)):
+                self._values[i] = 0
+
+
+verification_stats = VerificationStats()
@@ -0,0 +1,223 @@
+"""
+Per-page view models
+Each template gets a minimal, pre-flattened context instead of the whole
+resume: top-level values and namedtuple rows holding only what the page shows,
+with the slices, "+N more" tag counts, certification icon tones and animation
+delays the templates used to work out in their loops computed up front.
+Contexts are built once per content version and shared by every render
+"""
+
+from collections import namedtuple
+from flask import render_template
+from types import MappingProxyType
+from app.resume_content import get_resume
+import threading
+
+Footer = namedtuple('Footer', 'name title github linkedin medium website')
+Tag = namedtuple('Tag', 'label delay')
+SkillCard = namedtuple('SkillCard', 'category icon tags more delay progress_offset')
+SkillGroup = namedtuple('SkillGroup', 'category icon skills')
+JobCard = namedtuple('JobCard', 'position company duration description tags side delay')
+JobSummary = namedtuple('JobSummary', 'position company location duration responsibilities')
+CertificationCard = namedtuple('CertificationCard', 'name issuer icon tone issued code status')
+
+INDEX_SKILL_CARDS = 6
+INDEX_SKILL_TAGS = 3
+INDEX_JOBS = 3
+INDEX_JOB_TAGS = 4
+BIO_JOBS = 2
+BIO_RESPONSIBILITIES = 3
+BIO_SKILL_GROUPS = 3
+BIO_SKILLS = 4
+# Certification icon tones, first match wins
+CERTIFICATION_TONES = (('aws', 'text-warning'), ('redhat', 'text-danger'), ('dharmachakra', 'text-primary'))
+DEFAULT_CERTIFICATION_TONE = 'text-success'
+
+
+class ViewModels:
+    """Registry of page context builders with a per-content-version cache"""
+
+    def __init__(self):
+        self._builders = {}
+        self._contexts = {}
+        self._version = None
+        self._lock = threading.Lock()
+
+    def page(self, *templates):
+        """Register the decorated function as the context builder for ``templates``"""
+        def register(builder):
+            for template in templates:
+                self._builders[template] = builder
+            return builder
+        return register
+
+    def get(self, template):
+        """Return the read-only context for ``template`` under the current content version"""
+        resume = get_resume()
+        with self._lock:
+            if resume.version != self._version:
+                self._contexts = {}
+                self._version = resume.version
+            context = self._contexts.get(template)
+            if context is None:
+                context = MappingProxyType(self._builders[template](resume))
+                self._contexts[template] = context
+        return context
+
+    def render(self, template, **extra):
+        return render_template(template, **self.get(template), **extra)
+
+    def clear(self):
+        with self._lock:
+            self._contexts = {}
+            self._version = None
+
+
+view_models = ViewModels()
+
+
+def _delay(index, step):
+    # Same arithmetic the templates did with loop.index, so the markup is unchanged
+    return f"{index * step}s"
+
+
+def _footer(resume):
+    info = resume.personal_info
+    return Footer(info.name, info.title, info.github, info.linkedin, info.medium, info.website)
+
+
+def _certification_tone(icon):
+    for marker, tone in CERTIFICATION_TONES:
+        if marker in icon:
+            return tone
+    return DEFAULT_CERTIFICATION_TONE
+
+
+@view_models.page('404.html', '500.html', 'resume_access.html')
+def footer_only(resume):
+    return {'footer': _footer(resume)}
+
+
+@view_models.page('index.html')
+def index_page(resume):
+    info = resume.personal_info
+    skill_cards = []
+    for i, (category, group) in enumerate(list(resume.skills.items())[:INDEX_SKILL_CARDS], 1):
+        skill_cards.append(SkillCard(
+            category=category,
+            icon=group.icon,
+            tags=tuple(Tag(skill, _delay(j, 0.1)) for j, skill in enumerate(group.skills[:INDEX_SKILL_TAGS], 1)),
+            more=max(len(group.skills) - INDEX_SKILL_TAGS, 0),
+            delay=_delay(i, 0.1),
+            progress_offset=157 - i * 20
+        ))
+    jobs = []
+    for i, job in enumerate(resume.experience[:INDEX_JOBS], 1):
+        jobs.append(JobCard(
+            position=job.position,
+            company=job.company,
+            duration=job.duration,
+            description=job.description,
+            tags=tuple(Tag(tech, _delay(j, 0.1)) for j, tech in enumerate(job.technologies[:INDEX_JOB_TAGS], 1)),
+            side='Left' if i % 2 == 1 else 'Right',
+            delay=_delay(i, 0.2)
+        ))
+    return {
+        'footer': _footer(resume),
+        'name': info.name,
+        'headline': info.title,
+        'bio': resume.bio,
+        'profile_image': info.profile_image,
+        'city': info.location.split(',')[0],
+        'email': info.email,
+        'skill_cards': tuple(skill_cards),
+        'jobs': tuple(jobs)
+    }
+
+
+@view_models.page('bio.html')
+def bio_page(resume):
+    info = resume.personal_info
+    return {
+        'footer': _footer(resume),
+        'name': info.name,
+        'headline': info.title,
+        'profile_image': info.profile_image,
+        'email': info.email,
+        'phone': info.phone,
+        'location': info.location,
+        'bio': resume.bio,
+        'recent_jobs': tuple(
+            JobSummary(job.position, job.company, job.location, job.duration, job.responsibilities[:BIO_RESPONSIBILITIES])
+            for job in resume.experience[:BIO_JOBS]
+        ),
+        'key_skills': tuple(
+            SkillGroup(category, group.icon, group.skills[:BIO_SKILLS])
+            for category, group in list(resume.skills.items())[:BIO_SKILL_GROUPS]
+        )
+    }
+
+
+@view_models.page('experience.html')
+def experience_page(resume):
+    stats = resume.stats
+    return {
+        'footer': _footer(resume),
+        'name': resume.personal_info.name,
+        'jobs': resume.experience,
+        'years_experience': stats.years_experience,
+        'uptime_achieved': stats.uptime_achieved,
+        'support_hours': stats.support_hours,
+        'cost_savings': stats.cost_savings
+    }
+
+
+@view_models.page('skills.html')
+def skills_page(resume):
+    return {
+        'footer': _footer(resume),
+        'name': resume.personal_info.name,
+        'skill_groups': tuple(SkillGroup(category, group.icon, group.skills) for category, group in resume.skills.items())
+    }
+
+
+@view_models.page('education.html')
+def education_page(resume):
+    return {
+        'footer': _footer(resume),
+        'name': resume.personal_info.name,
+        'education': resume.education,
+        'certifications': tuple(
+            CertificationCard(cert.name, cert.issuer, cert.icon, _certification_tone(cert.icon), cert.issued, cert.code, cert.status)
+            for cert in resume.certifications
+        )
+    }
+
+
+@view_models.page('contact.html')
+def contact_page(resume):
+    info = resume.personal_info
+    return {
+        'footer': _footer(resume),
+        'name': info.name,
+        'email': info.email,
+        'phone': info.phone,
+        'location': info.location,
+        'website': info.website,
+        'github': info.github,
+        'linkedin': info.linkedin,
+        'medium': info.medium
+    }
+
+
+@view_models.page('projects.html')
+def projects_page(resume):
+    stats = resume.stats
+    return {
+        'footer': _footer(resume),
+        'projects': resume.projects,
+        'portfolio_images': resume.portfolio_images,
+        'projects_completed': stats.projects_completed,
+        'cost_savings': stats.cost_savings,
+        'uptime_achieved': stats.uptime_achieved
+    }
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for template precompilation and the Jinja bytecode cache
+Each scenario boots the app in a fresh interpreter and measures create_app time
+and the time to first byte of the first request to each page
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+PAGES = ['/', '/bio', '/experience', '/skills', '/education', '/projects', '/contact', '/resume-access']
+REPEAT = 5
+
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+from app import create_app
+app = create_app()
+startup = time.perf_counter() - started
+client = app.test_client()
+first_bytes = {}
+for page in json.loads(sys.argv[1]):
+    started = time.perf_counter()
+    response = client.get(page)
+    next(iter(response.response))
+    first_bytes[page] = time.perf_counter() - started
+print(json.dumps({'startup': startup, 'first_bytes': first_bytes}))
+"""
+
+
+def run_child(env_overrides):
+    env = dict(os.environ, PAGE_CACHE_PRELOAD='false', AUDIT_LOG_ENABLED='false', **env_overrides)
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD, json.dumps(PAGES)],
+        env=env, capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def best_of(env_overrides, prepare=None):
+    runs = []
+    for _ in range(REPEAT):
+        if prepare:
+            prepare()
+        runs.append(run_child(env_overrides))
+    startup = min(run['startup'] for run in runs)
+    first_byte = min(sum(run['first_bytes'].values()) for run in runs)
+    return startup, first_byte
+
+
+def main():
+    print("🚀 Startup and time-to-first-byte benchmark")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        def empty_cache():
+            for name in os.listdir(cache_dir):
+                os.remove(os.path.join(cache_dir, name))
+
+        scenarios = [
+            ('Lazy compilation', {'TEMPLATE_PRECOMPILE': 'false', 'TEMPLATE_BYTECODE_CACHE_DIR': ''}, None),
+            ('Precompile, cold cache', {'TEMPLATE_PRECOMPILE': 'true', 'TEMPLATE_BYTECODE_CACHE_DIR': cache_dir}, empty_cache),
+            ('Precompile, warm cache', {'TEMPLATE_PRECOMPILE': 'true', 'TEMPLATE_BYTECODE_CACHE_DIR': cache_dir}, None),
+        ]
+
+        try:
+            results = [(label, best_of(env, prepare)) for label, env, prepare in scenarios]
+        except subprocess.CalledProcessError as e:
+            print(f"   ❌ App failed to start: {e.stderr.strip().splitlines()[-1]}")
+            return False
+
+    print(f"   {'Scenario':<26}{'create_app':>12}{'first bytes*':>14}")
+    for label, (startup, first_byte) in results:
+        print(f"   {label:<26}{startup * 1000:>10.1f}ms{first_byte * 1000:>12.1f}ms")
+    print(f"   * summed over the first request to {len(PAGES)} pages, best of {REPEAT} runs")
+
+    lazy_first_byte = results[0][1][1]
+    warm_first_byte = results[2][1][1]
+    print(f"   ⏱️  First-request speedup with precompiled templates: {lazy_first_byte / warm_first_byte:.1f}x")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
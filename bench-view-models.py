@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Per-page render benchmark for the view models
+Renders each public template twice: the version from before the view models
+with the whole resume as context, and the current one with its view model
+and cached layout fragments. Reports attribute/item lookups and time per render
+
+Usage: python bench-view-models.py [baseline git ref]
+The baseline defaults to the revision that introduced app/view_models.py,
+or HEAD while the view models are still uncommitted
+"""
+
+import os
+import subprocess
+import sys
+import timeit
+
+from jinja2 import DictLoader
+
+from app import create_app
+from app.resume_content import get_resume
+from app.view_models import view_models
+
+PAGES = [
+    ('index.html', 'home'),
+    ('bio.html', 'bio'),
+    ('experience.html', 'experience'),
+    ('skills.html', 'skills'),
+    ('education.html', 'education'),
+    ('contact.html', 'contact'),
+    ('projects.html', 'projects'),
+    ('resume_access.html', 'resume'),
+    ('404.html', None),
+]
+ROOT = os.path.dirname(os.path.abspath(__file__))
+NUMBER = 200
+REPEAT = 7
+
+
+def git(*args):
+    return subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+
+
+def baseline_ref():
+    if len(sys.argv) > 1:
+        return sys.argv[1]
+    added = git('log', '--diff-filter=A', '--format=%H', '--', 'app/view_models.py').split()
+    return f"{added[-1]}^" if added else 'HEAD'
+
+
+def baseline_templates(ref):
+    names = git('ls-tree', '--name-only', ref, 'app/templates/').split()
+    return {
+        os.path.basename(name): git('show', f"{ref}:{name}")
+        for name in names if name.endswith('.html')
+    }
+
+
+def count_lookups(env, render):
+    """Render once with the environment's getattr/getitem counting calls"""
+    counts = [0]
+    getattr_, getitem = env.getattr, env.getitem
+
+    def counting_getattr(obj, attribute):
+        counts[0] += 1
+        return getattr_(obj, attribute)
+
+    def counting_getitem(obj, argument):
+        counts[0] += 1
+        return getitem(obj, argument)
+
+    env.getattr, env.getitem = counting_getattr, counting_getitem
+    try:
+        render()
+    finally:
+        del env.getattr, env.getitem
+    return counts[0]
+
+
+def main():
+    app = create_app()
+    ref = baseline_ref()
+    try:
+        templates = baseline_templates(ref)
+    except subprocess.CalledProcessError as e:
+        print(f"   ❌ Could not read baseline templates at {ref}: {e.stderr.strip()}")
+        return False
+    baseline_env = app.jinja_env.overlay(loader=DictLoader(templates))
+
+    print("🧩 Per-page view model render benchmark")
+    print(f"   Baseline templates: {ref}")
+    print("=" * 70)
+    print(f"   {'Template':<20}{'lookups':>16}{'baseline':>12}{'view model':>12}{'speedup':>9}")
+
+    totals = [0.0, 0.0]
+    with app.test_request_context('/'):
+        for template, current_page in PAGES:
+            extra = {'current_page': current_page} if current_page else {}
+
+            def render_baseline():
+                context = {'data': get_resume(), **extra}
+                app.update_template_context(context)
+                return baseline_env.get_template(template).render(context)
+
+            def render_view_model():
+                context = {**view_models.get(template), **extra}
+                app.update_template_context(context)
+                return app.jinja_env.get_template(template).render(context)
+
+            if ' '.join(render_baseline().split()) != ' '.join(render_view_model().split()):
+                print(f"   ❌ {template}: view model output differs from the baseline")
+                return False
+
+            lookups = (count_lookups(baseline_env, render_baseline), count_lookups(app.jinja_env, render_view_model))
+            # Alternate the two so drift on a noisy host affects both alike
+            samples = ([], [])
+            for _ in range(REPEAT):
+                samples[0].append(timeit.timeit(render_baseline, number=NUMBER) / NUMBER)
+                samples[1].append(timeit.timeit(render_view_model, number=NUMBER) / NUMBER)
+            baseline, current = min(samples[0]), min(samples[1])
+            totals[0] += baseline
+            totals[1] += current
+            print(
+                f"   {template:<20}{lookups[0]:>7} → {lookups[1]:<6}"
+                f"{baseline * 1e6:>10.0f}µs{current * 1e6:>10.0f}µs{baseline / current:>8.2f}x"
+            )
+
+    print("-" * 70)
+    print(f"   {'All pages':<36}{totals[0] * 1e6:>10.0f}µs{totals[1] * 1e6:>10.0f}µs{totals[0] / totals[1]:>8.2f}x")
+    print("   ✅ Every page renders the same markup from its view model")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Local checks for the audit log writer
+Several processes, as gunicorn workers would, write to one AUDIT_LOG_FILE
+while the file is rotated underneath them the way logrotate does it
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from flask import Flask
+
+from app.audit_log import AuditLog
+
+PROCESSES = 4
+THREADS = 4
+RECORDS = 2000
+ROTATIONS = 5
+
+
+def write_records(path):
+    app = Flask('worker')
+    app.config.update(AUDIT_LOG_FILE=path, AUDIT_LOG_FLUSH_INTERVAL=0.01, AUDIT_LOG_BATCH_SIZE=32)
+    log = AuditLog(app)
+
+    def emit(thread):
+        for index in range(RECORDS // THREADS):
+            log.emit('resume_download', pid=os.getpid(), thread=thread, index=index, padding='x' * 200)
+            if index % 50 == 0:
+                time.sleep(0.001)
+
+    threads = [threading.Thread(target=emit, args=(thread,)) for thread in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log.flush()
+    stats = log.stats()
+    sys.exit(0 if stats['written'] == stats['enqueued'] == RECORDS and not stats['dropped'] else 1)
+
+
+def main():
+    print("📝 Audit log writer checks")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'audit.log')
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=write_records, args=(path,)) for _ in range(PROCESSES)]
+        for worker in workers:
+            worker.start()
+
+        rotated = 0
+        while any(worker.is_alive() for worker in workers) and rotated < ROTATIONS:
+            time.sleep(0.05)
+            if os.path.exists(path):
+                rotated += 1
+                os.replace(path, f"{path}.{rotated}")
+        for worker in workers:
+            worker.join()
+
+        counters_ok = all(worker.exitcode == 0 for worker in workers)
+        print(f"   {'✅' if counters_ok else '❌'} Each worker's counters add up: {RECORDS} enqueued and written")
+
+        records, broken = [], 0
+        for name in os.listdir(directory):
+            with open(os.path.join(directory, name), encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        broken += 1
+        unique = {(record['pid'], record['thread'], record['index']) for record in records}
+        expected = PROCESSES * RECORDS
+        complete = broken == 0 and len(records) == len(unique) == expected
+        print(f"   {'✅' if complete else '❌'} {len(unique)}/{expected} records across {rotated} rotations, "
+              f"{broken} broken lines")
+        return counters_ok and complete
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
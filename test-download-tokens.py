@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Local checks for single-use resume download tokens
+Runs against the app in-process with the Flask test client
+"""
+
+import os
+import sys
+import tempfile
+
+from flask import Flask
+
+os.environ.pop('RECAPTCHA_SECRET_KEY', None)
+os.environ['AUDIT_LOG_ENABLED'] = 'false'
+
+from app import create_app, limiter
+from app.download_tokens import DownloadTokens
+from app.server_session import LocalRedisStandIn, backend_from_url
+
+
+def worker_tokens(store):
+    """A DownloadTokens bound to its own app, as in a separate gunicorn worker"""
+    app = Flask('worker')
+    app.config.update(SECRET_KEY='test-secret', DOWNLOAD_TOKEN_STORE=store)
+    return DownloadTokens(app)
+
+
+def issue_token(client):
+    response = client.post('/verify-access', data={'email': 'recruiter@example.com'})
+    location = response.headers.get('Location', '')
+    if response.status_code != 302 or 'token=' not in location:
+        return None
+    return location
+
+
+def check(label, response, expected):
+    if response.status_code == expected:
+        print(f"   ✅ {label}: {response.status_code}")
+        return True
+    print(f"   ❌ {label}: expected {expected}, got {response.status_code}")
+    return False
+
+
+def main():
+    app = create_app()
+    limiter.enabled = False
+    client = app.test_client()
+
+    print("🔐 Download token replay checks")
+    print("=" * 50)
+
+    download = issue_token(client)
+    if download is None:
+        print("   ❌ Could not obtain a download token")
+        return False
+
+    results = [
+        check("HEAD with an unused token", client.head(download), 200),
+        check("First download after the HEAD", client.get(download), 200),
+        check("Replay of a used token", client.get(download), 302),
+        check("Replay with Range: bytes=0-", client.get(download, headers={'Range': 'bytes=0-'}), 302),
+        check("Replay with a suffix range", client.get(download, headers={'Range': 'bytes=-1000000'}), 302),
+        check("Replay with a failing If-Range", client.get(
+            download, headers={'Range': 'bytes=100-', 'If-Range': '"stale"'}), 302),
+        check("Resume past byte 0", client.get(download, headers={'Range': 'bytes=100-'}), 206),
+    ]
+
+    download = issue_token(client)
+    results += [
+        check("Fresh token with Range: bytes=0-", client.get(download, headers={'Range': 'bytes=0-'}), 206),
+        check("Replay with Range: bytes=0-", client.get(download, headers={'Range': 'bytes=0-'}), 302),
+    ]
+
+    print("\n🔁 Consumed nonces across workers")
+    with tempfile.TemporaryDirectory() as directory:
+        server = LocalRedisStandIn().start()
+        for store in (f"sqlite:///{directory}/tokens.db", server.url):
+            first, second = worker_tokens(store), worker_tokens(store)
+            token = first.issue()
+            claims = second.verify(token)
+            shared = (
+                first.consume(first.verify(token))
+                and second.verify(token) is None
+                and not second.consume(claims)
+            )
+            results.append(shared)
+            print(f"   {'✅' if shared else '❌'} {store.split(':')[0]}: a token used in one worker is refused in the other")
+
+            sessions = backend_from_url(store)
+            nonce = claims['nonce'].hex()
+            apart = sessions.get(nonce) is None and first.consumed.backend.get(nonce) is not None
+            results.append(apart)
+            print(f"   {'✅' if apart else '❌'} {store.split(':')[0]}: nonces are kept apart from session records")
+        server.shutdown()
+
+    tokens = worker_tokens('memory://')
+    first = tokens.issue()
+    tokens.consume(tokens.verify(first))
+    for _ in range(20000):
+        tokens.consume(tokens.verify(tokens.issue()))
+    kept = tokens.verify(first) is None
+    results.append(kept)
+    print(f"   {'✅' if kept else '❌'} memory: a used nonce survives 20000 later consumptions")
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
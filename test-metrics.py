@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Local checks for the shared metrics arena
+Builds the app repeatedly in one process, as tests and CLI commands do, and
+checks that series are registered once and the arena stops growing
+"""
+
+import os
+import sys
+
+os.environ['AUDIT_LOG_ENABLED'] = 'false'
+
+from app import create_app, limiter
+from app.metrics import metrics
+
+APPS = 50
+
+
+def check(label, ok):
+    print(f"   {'✅' if ok else '❌'} {label}")
+    return ok
+
+
+def series(exposition):
+    return [line.rsplit(' ', 1)[0] for line in exposition.splitlines() if not line.startswith('#')]
+
+
+def main():
+    limiter.enabled = False
+    print("📈 Metrics registration checks")
+    print("=" * 50)
+
+    first = create_app()
+    used = metrics.arena.used
+    families = len(metrics.metrics)
+    for _ in range(APPS - 1):
+        app = create_app()
+    names = series(metrics.expose())
+
+    results = [
+        check(f"{APPS} create_app() calls leave the arena at {used} slots: {metrics.arena.used}",
+              metrics.arena.used == used),
+        check(f"Each family is registered once: {len(metrics.metrics)} families",
+              len(metrics.metrics) == families),
+        check(f"No series is exposed twice: {len(names)} series", len(names) == len(set(names))),
+    ]
+
+    before = metrics.requests.arena.values[metrics.requests.offsets[('main.health_check', '2xx')]]
+    first.test_client().get('/health')
+    app.test_client().get('/health')
+    after = metrics.requests.arena.values[metrics.requests.offsets[('main.health_check', '2xx')]]
+    results.append(check("Requests to every app count into the same series", after - before == 2))
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Local checks for the pre-rendered page cache
+Runs against the app in-process with the Flask test client, on a temporary
+copy of the templates so the working tree is never touched
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from jinja2 import FileSystemLoader
+
+from app import create_app
+from app.page_cache import page_cache
+
+MARKER = '<!-- edited-after-first-render -->'
+
+
+def main():
+    app = create_app()
+    app.debug = False
+    app.config['PAGE_CACHE_CHECK_INTERVAL'] = 0
+    client = app.test_client()
+
+    print("🗂️  Page cache template edit checks")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        templates = os.path.join(directory, 'templates')
+        shutil.copytree(os.path.join(app.root_path, 'templates'), templates)
+        app.jinja_loader = FileSystemLoader(templates)
+        app.jinja_env.cache.clear()
+        page_cache.clear()
+
+        if app.jinja_env.auto_reload:
+            print("   ❌ Jinja auto_reload is on; this check needs production settings")
+            return False
+
+        first = client.get('/skills')
+        if first.status_code != 200 or MARKER in first.get_data(as_text=True):
+            print(f"   ❌ Initial render failed: {first.status_code}")
+            return False
+        print("   ✅ Page rendered and cached")
+
+        path = os.path.join(templates, 'skills.html')
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+        # Inside the content block; a child template ignores anything outside its blocks
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source.replace('Technical Skills</h1>', 'Technical Skills</h1>' + MARKER, 1))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        second = client.get('/skills')
+        if MARKER not in second.get_data(as_text=True):
+            print("   ❌ Template edit not served: the cache re-rendered the old compiled template")
+            return False
+        print("   ✅ Template edit served after the cache noticed the new mtime")
+
+        third = client.get('/skills', headers={'If-None-Match': second.headers['ETag'].strip('"')})
+        if third.status_code != 304:
+            print(f"   ❌ Re-rendered page not cached: {third.status_code}")
+            return False
+        print("   ✅ Re-rendered page cached under the new version")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
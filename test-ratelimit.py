@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Local checks for the shared rate limit storage
+Simulates several worker processes, each with its own prefilter+file:// storage
+on one temporary SQLite file, sending a client's requests round-robin
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from limits import parse
+from limits.strategies import FixedWindowRateLimiter
+
+from app.ratelimit_storage import PrefilteredStorage
+
+LIMIT = '50/minute'
+CLIENT = '203.0.113.7'
+
+
+def workers(path, count):
+    return [FixedWindowRateLimiter(PrefilteredStorage(f"prefilter+file://{path}")) for _ in range(count)]
+
+
+def admitted(limiters, item, requests):
+    """Send ``requests`` hits round-robin; return the admitted count and the first rejected request"""
+    count, first_rejected = 0, None
+    for i in range(requests):
+        if limiters[i % len(limiters)].hit(item, CLIENT):
+            count += 1
+        elif first_rejected is None:
+            first_rejected = i + 1
+    return count, first_rejected
+
+
+def main():
+    item = parse(LIMIT)
+    results = []
+
+    print("🚦 Rate limit admission checks")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for processes in (1, 2, 20):
+            limiters = workers(os.path.join(directory, f"{processes}.db"), processes)
+            count, first_rejected = admitted(limiters, item, item.amount * 2)
+            syncs = sum(limiter.storage.shared_syncs for limiter in limiters)
+            ok = count == item.amount and first_rejected == item.amount + 1
+            results.append(ok)
+            print(f"   {'✅' if ok else '❌'} {processes:>2} processes at {LIMIT}: "
+                  f"{count} admitted, first 429 at request {first_rejected}, {syncs} shared writes")
+
+        limiters = workers(os.path.join(directory, 'remaining.db'), 2)
+        admitted(limiters, item, 20)
+        remaining = [limiter.get_window_stats(item, CLIENT).remaining for limiter in limiters]
+        # Each worker counts its own hits and never hits that did not happen
+        ok = all(item.amount - 20 <= seen <= item.amount - 10 for seen in remaining)
+        results.append(ok)
+        print(f"   {'✅' if ok else '❌'} Remaining after 20 round-robin hits on 2 workers: {remaining}")
+
+        for limiter in limiters:
+            limiter.storage.SYNC_INTERVAL = 0.05
+        time.sleep(0.1)
+        for limiter in limiters:
+            limiter.storage.flush()
+        remaining = [limiter.get_window_stats(item, CLIENT).remaining for limiter in limiters]
+        ok = remaining == [item.amount - 20] * 2
+        results.append(ok)
+        print(f"   {'✅' if ok else '❌'} Remaining once local hits reach the shared store after SYNC_INTERVAL: {remaining}")
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
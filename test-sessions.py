@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Local checks for server-side sessions
+Runs two app instances, as two gunicorn workers would be, against one
+temporary SQLite session file with the Flask test client
+"""
+
+import os
+import sys
+import tempfile
+
+from flask import session
+
+os.environ['AUDIT_LOG_ENABLED'] = 'false'
+
+from app import create_app, limiter
+from app.server_session import SESSION_ID_PATTERN
+
+CHOSEN_SID = 'A' * 43
+
+
+def worker(backend):
+    os.environ['SESSION_BACKEND'] = backend
+    app = create_app()
+
+    @app.route('/_session/write')
+    def write_session():
+        session['visits'] = session.get('visits', 0) + 1
+        return str(session['visits'])
+
+    @app.route('/_session/read')
+    def read_session():
+        return str(session.get('visits', 0))
+
+    return app
+
+
+def session_cookie(response, name):
+    for header in response.headers.getlist('Set-Cookie'):
+        if header.startswith(f"{name}="):
+            return header.split(';', 1)[0].split('=', 1)[1]
+    return None
+
+
+def check(label, ok):
+    print(f"   {'✅' if ok else '❌'} {label}")
+    return ok
+
+
+def main():
+    limiter.enabled = False
+    print("🍪 Server-side session checks")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        backend = f"sqlite:///{directory}/sessions.db"
+        first, second = worker(backend), worker(backend)
+        name = first.config['SESSION_COOKIE_NAME']
+        store = first.session_interface.backend
+        client = first.test_client()
+
+        client.set_cookie(name, CHOSEN_SID)
+        response = client.get('/_session/write')
+        sid = session_cookie(response, name)
+        results = [
+            check("A client-chosen unknown session ID is replaced with a fresh one",
+                  sid is not None and sid != CHOSEN_SID and SESSION_ID_PATTERN.match(sid) is not None),
+            check("Nothing is stored under the client-chosen ID", store.get(CHOSEN_SID) is None),
+        ]
+
+        response = client.get('/_session/write')
+        results += [
+            check("A known session ID is kept", session_cookie(response, name) in (None, sid)),
+            check("Its data is loaded", response.get_data(as_text=True) == '2'),
+        ]
+
+        other = second.test_client()
+        other.set_cookie(name, sid)
+        results.append(check("Another worker reads the same session",
+                             other.get('/_session/read').get_data(as_text=True) == '2'))
+
+        loads = first.session_interface.loads
+        response = first.test_client().get('/health')
+        results.append(check("Requests that never touch the session do no session I/O",
+                             first.session_interface.loads == loads and session_cookie(response, name) is None))
+
+        ttls = []
+        backend_set = store.set
+        store.set = lambda sid, data, ttl: (ttls.append(ttl), backend_set(sid, data, ttl))
+        client.get('/_session/write')
+        store.set = backend_set
+        results.append(check(f"Non-permanent sessions expire after SESSION_NON_PERMANENT_TTL: {ttls}",
+                             ttls == [first.config['SESSION_NON_PERMANENT_TTL']]))
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Local checks for the incremental static export
+Exports in-process (workers=0) into a temporary directory, on a temporary
+copy of the templates so the working tree is never touched, then re-runs the
+export after no change and after template edits
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from jinja2 import FileSystemLoader
+
+os.environ['AUDIT_LOG_ENABLED'] = 'false'
+
+from app import create_app
+from app.static_export import MANIFEST_NAME, static_export
+
+MARKER = '<!-- edited-between-exports -->'
+
+
+def check(label, ok):
+    print(f"   {'✅' if ok else '❌'} {label}")
+    return ok
+
+
+def edit(path, old, new):
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(source.replace(old, new, 1))
+
+
+def page_files(output):
+    with open(os.path.join(output, MANIFEST_NAME), encoding='utf-8') as f:
+        pages = json.load(f)['pages']
+    return pages, {path: os.stat(os.path.join(output, entry['file'])).st_mtime_ns for path, entry in pages.items()}
+
+
+def main():
+    app = create_app()
+    print("📦 Static export re-run checks")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        templates = os.path.join(directory, 'templates')
+        shutil.copytree(os.path.join(app.root_path, 'templates'), templates)
+        app.jinja_loader = FileSystemLoader(templates)
+        app.jinja_env.cache.clear()
+        output = os.path.join(directory, 'site')
+
+        stats = static_export.export(output, workers=0)
+        pages, written = page_files(output)
+        results = [check(f"First export renders every page: {stats['rendered']}/{stats['pages']}",
+                         stats['pages'] > 0 and stats['rendered'] == stats['pages'])]
+
+        stats = static_export.export(output, workers=0)
+        _, rewritten = page_files(output)
+        results += [
+            check(f"Re-run with nothing changed reuses every page: {stats['reused']}/{stats['pages']}",
+                  stats['rendered'] == 0 and stats['reused'] == stats['pages']),
+            check("Reused pages are not rewritten", rewritten == written),
+        ]
+
+        edit(os.path.join(templates, 'skills.html'), 'Technical Skills</h1>', 'Technical Skills</h1>' + MARKER)
+        app.jinja_env.cache.clear()
+        stats = static_export.export(output, workers=0)
+        pages, _ = page_files(output)
+        with open(os.path.join(output, pages['/skills']['file']), encoding='utf-8') as f:
+            edited = MARKER in f.read()
+        results += [
+            check(f"Editing skills.html re-renders only /skills: {stats['rendered']} rendered",
+                  stats['rendered'] == 1 and stats['reused'] == stats['pages'] - 1),
+            check("The re-rendered page has the edit", edited),
+        ]
+
+        layout = [path for path, entry in pages.items() if 'base.html' in entry['templates']]
+        edit(os.path.join(templates, 'base.html'), '<main class=', MARKER + '<main class=')
+        app.jinja_env.cache.clear()
+        stats = static_export.export(output, workers=0)
+        results.append(check(f"Editing base.html re-renders the {len(layout)} pages that extend it: "
+                             f"{stats['rendered']} rendered",
+                             len(layout) > 1 and stats['rendered'] == len(layout)))
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)